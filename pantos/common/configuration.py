@@ -1,18 +1,16 @@
 """Module for loading and parsing a configuration file.
 
 """
+import collections
 import errno
+import functools
 import importlib.resources
 import logging
 import os
 import pathlib
+import threading
 import typing
 
-import cerberus  # type: ignore
-import dotenv
-import pyaml_env  # type: ignore
-import yaml
-
 from pantos.common.exceptions import BaseError
 
 _logger = logging.getLogger(__name__)
@@ -34,22 +32,83 @@ if os.environ.get('PANTOS_CONFIG'):
     _CONFIGURATION_PATHS.insert(0, pathlib.Path(os.environ['PANTOS_CONFIG']))
 
 
-class _CustomValidator(cerberus.Validator):
-    def _validate_one_not_present(self, other: str, field: str, value: str):
-        if (bool(value)) == (bool(self.document.get(other))):
-            self._error(field, "only one field can be present: " + other)
-
-    def _normalize_coerce_load_if_file(self, value: str):
-        path = pathlib.Path(value)
+def _remove_duplicate_paths(paths: list[pathlib.Path]) -> list[pathlib.Path]:
+    # The resolved paths are only used for detecting duplicates (the
+    # original paths are kept since symlinks may be retargeted later)
+    resolved_paths = set()
+    unique_paths = []
+    for path in paths:
         try:
-            # This method may trigger an exception if the path is not valid
-            if path.is_file():
-                with open(path, 'r') as file:
-                    return file.read()
-        except OSError as error:
-            if error.errno != errno.ENAMETOOLONG:
-                raise error
-        return value
+            resolved_path = path.resolve()
+        except (OSError, RuntimeError):
+            # Perhaps the path is not accessible or contains a symlink loop
+            resolved_path = path
+        if resolved_path in resolved_paths:
+            _logger.debug(f'ignoring duplicate configuration path {path}')
+        else:
+            resolved_paths.add(resolved_path)
+            unique_paths.append(path)
+    return unique_paths
+
+
+# Remove duplicates while preserving the priority order
+_CONFIGURATION_PATHS = _remove_duplicate_paths(_CONFIGURATION_PATHS)
+
+# Parsed .env files with their modification times (in nanoseconds)
+_ENV_FILE_CACHE: dict[pathlib.Path, tuple[int, dict[str, str | None]]] = {}
+
+# Maximum number of validators cached per thread
+_VALIDATOR_CACHE_SIZE = 16
+
+# Validators with already validated validation schemas (keyed by the
+# schema's representation so that in-place schema changes are detected;
+# Cerberus validators are stateful, so each thread has its own cache)
+_validator_cache = threading.local()
+
+
+def _get_validator(validation_schema: dict[str, typing.Any]) -> typing.Any:
+    validators = getattr(_validator_cache, 'validators', None)
+    if validators is None:
+        validators = collections.OrderedDict()
+        _validator_cache.validators = validators
+    schema_key = repr(validation_schema)
+    validator = validators.get(schema_key)
+    if validator is None:
+        # Create the validator and validate the validation schema
+        validator = _get_custom_validator_class()(validation_schema)
+        validators[schema_key] = validator
+        if len(validators) > _VALIDATOR_CACHE_SIZE:
+            validators.popitem(last=False)
+    else:
+        validators.move_to_end(schema_key)
+    return validator
+
+
+@functools.cache
+def _get_custom_validator_class() -> type:
+    # Cerberus is only imported once a configuration is validated
+    import cerberus  # type: ignore
+
+    class _CustomValidator(cerberus.Validator):
+        def _validate_one_not_present(self, other: str, field: str,
+                                      value: str):
+            if (bool(value)) == (bool(self.document.get(other))):
+                self._error(field, "only one field can be present: " + other)
+
+        def _normalize_coerce_load_if_file(self, value: str):
+            path = pathlib.Path(value)
+            try:
+                # This method may trigger an exception if the path is not
+                # valid
+                if path.is_file():
+                    with open(path, 'r') as file:
+                        return file.read()
+            except OSError as error:
+                if error.errno != errno.ENAMETOOLONG:
+                    raise error
+            return value
+
+    return _CustomValidator
 
 
 class ConfigError(BaseError):
@@ -70,6 +129,8 @@ class Config:
         file path is provided for loading the configuration.
 
     """
+    __slots__ = ('default_file_name', '_config_dict')
+
     def __init__(self, default_file_name: str):
         """Initialize a configuration instance.
 
@@ -82,7 +143,7 @@ class Config:
 
         """
         self.default_file_name = default_file_name
-        self.__config_dict: dict[str, typing.Any] | None = None
+        self._config_dict: dict[str, typing.Any] | None = None
 
     def __getitem__(self, key: str) -> typing.Any:
         """Get the configuration value for a given key.
@@ -103,12 +164,13 @@ class Config:
             If the configuration has not been loaded.
 
         """
-        if self.__config_dict is None:
+        config_dict = self._config_dict
+        if config_dict is None:
             raise ConfigError('configuration not yet loaded')
-        return self.__config_dict[key]
+        return config_dict[key]
 
     def __str__(self) -> str:
-        return str(self.__config_dict)
+        return str(self._config_dict)
 
     def is_loaded(self) -> bool:
         """Determine if the configuration has been loaded.
@@ -119,7 +181,7 @@ class Config:
             True if the configuration has been loaded.
 
         """
-        return self.__config_dict is not None
+        return self._config_dict is not None
 
     def load(self, validation_schema: dict[str, typing.Any],
              file_path: str | None = None) -> None:
@@ -146,7 +208,7 @@ class Config:
         _logger.info(f'loading configuration from file {path}')
         config_dict = self.__parse_file(path)
         # Validate the configuration and add default configuration values
-        self.__config_dict = self.__validate(config_dict, validation_schema)
+        self._config_dict = self.__validate(config_dict, validation_schema)
 
     def __find_file(self, file_path: str | None) -> pathlib.Path:
         if file_path is not None:
@@ -177,11 +239,14 @@ class Config:
         raise ConfigError('no configuration file found')
 
     def __parse_file(self, path: pathlib.Path) -> dict[str, typing.Any]:
+        # The YAML parsing libraries are only imported once a
+        # configuration is loaded
+        import pyaml_env  # type: ignore
+        import yaml
+
+        path_str = path.as_posix()
         # List of potential .env file paths
-        env_files = [
-            pathlib.Path(path.as_posix() + '.env'),
-            pathlib.Path(path.with_suffix('.env').as_posix())
-        ]
+        env_files = [pathlib.Path(path_str + '.env'), path.with_suffix('.env')]
         if os.environ.get('PANTOS_ENV_FILE'):
             _logger.info('loading env variables from environment defined file '
                          'PANTOS_ENV_FILE')
@@ -189,14 +254,13 @@ class Config:
 
         # Extend env_files with .env paths from _CONFIGURATION_PATHS
         env_files.extend(
-            pathlib.Path(str(p)).with_name(
-                str(p.name) + self.default_file_name + '.env')
+            p.with_name(p.name + self.default_file_name + '.env')
             for p in _CONFIGURATION_PATHS)
-        # Iterate over the potential .env file paths
-        for env_file in env_files:
+        # Iterate over the potential .env file paths (without duplicates)
+        for env_file in dict.fromkeys(env_files):
             try:
                 if env_file.is_file():
-                    dotenv.load_dotenv(env_file)
+                    self.__load_env_file(env_file)
                     _logger.info(f'loaded .env from file {env_file}')
                     break
             except OSError:
@@ -206,9 +270,20 @@ class Config:
             except Exception:
                 _logger.error(f'unable to load .env file {env_file}',
                               exc_info=True)
+
+        # Prefer the LibYAML-based loader if it is available
+        base_loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+        # pyaml_env registers its resolver and constructor on the given
+        # loader class, so use a throwaway subclass to keep the global
+        # loader untouched
+        class _Loader(base_loader):  # type: ignore
+            pass
+
         # Parse the YAML code in the configuration file
         try:
-            return pyaml_env.parse_config(path.as_posix(), default_value='')
+            return pyaml_env.parse_config(path_str, default_value='',
+                                          loader=_Loader)
         except yaml.YAMLError as error:
             if hasattr(error, 'problem_mark'):
                 line = error.problem_mark.line + 1
@@ -218,12 +293,29 @@ class Config:
             else:
                 raise ConfigError('YAML code in configuration file invalid')
 
+    def __load_env_file(self, env_file: pathlib.Path) -> None:
+        import dotenv
+
+        # Only parse the .env file again if it has been modified
+        modification_time = env_file.stat().st_mtime_ns
+        cached_env_file = _ENV_FILE_CACHE.get(env_file)
+        if cached_env_file is None or cached_env_file[0] != modification_time:
+            env_values = dotenv.dotenv_values(env_file)
+            _ENV_FILE_CACHE[env_file] = (modification_time, env_values)
+        else:
+            env_values = cached_env_file[1]
+        # Existing environment variables are not overridden
+        for key, value in env_values.items():
+            if value is not None and key not in os.environ:
+                os.environ[key] = value
+
     def __validate(
             self, config_dict: dict[str, typing.Any],
             validation_schema: dict[str, typing.Any]) -> dict[str, typing.Any]:
-        # Create the validator and validate the validation schema
+        import cerberus  # type: ignore
+
         try:
-            validator = _CustomValidator(validation_schema)
+            validator = _get_validator(validation_schema)
         except cerberus.schema.SchemaError as error:
             raise ConfigError(f'validation schema invalid: {error}')
         # Validate the configuration
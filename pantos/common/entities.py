@@ -10,7 +10,7 @@ from pantos.common.types import Amount
 from pantos.common.types import BlockchainAddress
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ServiceNodeBid:
     """Entity that represents a Pantos service node bid.
 
@@ -50,7 +50,7 @@ class ServiceNodeBid:
     signature: str
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class TokenDeploymentRequest:
     """Request data for submitting a new deployment request to the
     Pantos token creator service.
@@ -152,10 +152,10 @@ class ServiceNodeTransferStatus(enum.IntEnum):
             If the type conversion is not possible.
 
         """
-        for status in ServiceNodeTransferStatus:
-            if name.upper() == status.name:
-                return status
-        raise NameError(name)
+        try:
+            return ServiceNodeTransferStatus.__members__[name.upper()]
+        except KeyError:
+            raise NameError(name) from None
 
 
 class TransactionStatus(enum.Enum):
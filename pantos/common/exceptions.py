@@ -8,6 +8,9 @@ from pantos.common.blockchains.enums import Blockchain
 
 E = typing.TypeVar('E', bound='BaseError')
 
+_error_classes: dict[tuple[type, type | None], type] = {}
+"""Error classes already created by ErrorCreator instances."""
+
 
 class ErrorCreator(abc.ABC, typing.Generic[E]):
     """Base class that helps to properly create Pantos errors for a
@@ -54,20 +57,25 @@ class ErrorCreator(abc.ABC, typing.Generic[E]):
 
         """
         error_class = self.get_error_class()
-        error_classes: tuple[type[E], ...] = ()
-        if specialized_error_class is not None:
-            error_classes += (specialized_error_class, )
-        error_classes += (error_class, )
-
-        class Error(*error_classes):  # type: ignore
-            pass
-
-        Error.__name__ = (error_class.__name__ if specialized_error_class
-                          is None else specialized_error_class.__name__)
-        Error.__qualname__ = Error.__name__
-        Error.__module__ = error_class.__module__
-        return Error(
-            **kwargs) if message is None else Error(message=message, **kwargs)
+        cache_key = (error_class, specialized_error_class)
+        combined_error_class = _error_classes.get(cache_key)
+        if combined_error_class is None:
+            error_classes: tuple[type[E], ...] = ()
+            if specialized_error_class is not None:
+                error_classes += (specialized_error_class, )
+            error_classes += (error_class, )
+
+            class Error(*error_classes):  # type: ignore
+                pass
+
+            Error.__name__ = (error_class.__name__ if specialized_error_class
+                              is None else specialized_error_class.__name__)
+            Error.__qualname__ = Error.__name__
+            Error.__module__ = error_class.__module__
+            combined_error_class = _error_classes[cache_key] = Error
+        if message is None:
+            return combined_error_class(**kwargs)
+        return combined_error_class(message=message, **kwargs)
 
 
 class BaseError(Exception):
@@ -94,11 +102,12 @@ class BaseError(Exception):
         self.details = kwargs
 
     def __str__(self) -> str:
-        string = f'{super().__str__()}'
+        string = super().__str__()
         if self.details is not None:
-            for key, value in self.details.items():
-                value = value.name if isinstance(value, Blockchain) else value
-                string += f' - {key}: {value}'
+            string += ''.join(
+                f' - {key}: '
+                f'{value.name if isinstance(value, Blockchain) else value}'
+                for key, value in self.details.items())
         return string
 
 
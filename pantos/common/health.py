@@ -3,17 +3,58 @@
 """
 import concurrent.futures
 import dataclasses
+import logging
+import threading
+import typing
 
+from pantos.common.blockchains.base import BlockchainUtilities
 from pantos.common.blockchains.base import UnhealthyNode
 from pantos.common.blockchains.enums import Blockchain
 from pantos.common.blockchains.factory import get_blockchain_utilities
 from pantos.common.exceptions import NotInitializedError
 
+_logger = logging.getLogger(__name__)
+"""Logger for this module."""
+
 _blockchain_nodes: dict[Blockchain, tuple[list[str],
                                           float | tuple | None]] = {}
 
+_blockchain_utilities: dict[Blockchain, BlockchainUtilities] = {}
+"""Blockchain utilities already used for checking the blockchain
+nodes."""
+
+_MAX_CONCURRENT_NODES_HEALTH_CHECKS = 4
+"""Maximum number of health checks (e.g. of concurrent requests and the
+background refresher) that can run without waiting for each other."""
+
+_executor = concurrent.futures.ThreadPoolExecutor(
+    max_workers=len(Blockchain) * _MAX_CONCURRENT_NODES_HEALTH_CHECKS,
+    thread_name_prefix='nodes-health')
+"""Executor for checking the blockchain nodes concurrently (its
+threads are reused across health checks)."""
+
+_blockchain_nodes_generation = 0
+"""Generation of the blockchain nodes (incremented each time they are
+initialized)."""
+
+_nodes_health_snapshot: typing.Optional[tuple[int, dict[Blockchain,
+                                                        'NodesHealth']]] = None
+"""Most recent health status of the blockchain nodes together with the
+generation of the blockchain nodes it has been checked for."""
+
+_nodes_health_refresher: typing.Optional[threading.Thread] = None
+"""Background thread for refreshing the cached health status of the
+blockchain nodes."""
+
+_nodes_health_refresher_stopped: typing.Optional[threading.Event] = None
+"""Event for stopping the background thread."""
+
+_nodes_health_lock = threading.Lock()
+"""Lock for updating the cached health status of the blockchain nodes
+and starting or stopping the background thread."""
+
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class NodesHealth:
     """Entity which provides information about the health status
     of the nodes requested for a blockchain network.
@@ -47,28 +88,100 @@ def check_blockchain_nodes_health() -> dict[Blockchain, NodesHealth]:
         If the blockchain nodes have not been initialized yet.
 
     """
-    if _blockchain_nodes == {}:
+    # The blockchain nodes may be initialized again concurrently
+    blockchain_nodes = _blockchain_nodes
+    blockchain_utilities_cache = _blockchain_utilities
+    if not blockchain_nodes:
         raise NotInitializedError(
             'the blockchain nodes have not been initialized yet')
     nodes_health = {}
 
-    with concurrent.futures.ThreadPoolExecutor() as executor:
-        future_to_blockchain = {
-            executor.submit(
-                get_blockchain_utilities(blockchain).get_unhealthy_nodes,  # noqa
-                _blockchain_nodes[blockchain][0],
-                _blockchain_nodes[blockchain][1]): blockchain
-            for blockchain in _blockchain_nodes
-        }
-        for future in concurrent.futures.as_completed(future_to_blockchain):
-            blockchain = future_to_blockchain[future]
-            unhealthy_nodes = future.result()
-            nodes_health[blockchain] = NodesHealth(
-                len(_blockchain_nodes[blockchain][0]) - len(unhealthy_nodes),
-                len(unhealthy_nodes), unhealthy_nodes)
+    future_to_blockchain_nodes = {}
+    for blockchain, (nodes, timeout) in blockchain_nodes.items():
+        blockchain_utilities = blockchain_utilities_cache.get(blockchain)
+        if blockchain_utilities is None:
+            blockchain_utilities = get_blockchain_utilities(blockchain)
+            blockchain_utilities_cache[blockchain] = blockchain_utilities
+        future = _executor.submit(blockchain_utilities.get_unhealthy_nodes,
+                                  nodes, timeout)
+        future_to_blockchain_nodes[future] = (blockchain, nodes)
+    for future in concurrent.futures.as_completed(future_to_blockchain_nodes):
+        blockchain, nodes = future_to_blockchain_nodes[future]
+        unhealthy_nodes = future.result()
+        unhealthy_total = len(unhealthy_nodes)
+        nodes_health[blockchain] = NodesHealth(
+            len(nodes) - unhealthy_total, unhealthy_total, unhealthy_nodes)
     return nodes_health
 
 
+def get_cached_blockchain_nodes_health() -> dict[Blockchain, NodesHealth]:
+    """Get the most recent health status of the blockchain nodes. As
+    long as the background refresher has not been started (see
+    start_nodes_health_refresher), the health of the blockchain nodes
+    is checked on each call.
+
+    Returns
+    -------
+    dict[Blockchain, NodesHealth]
+        The most recent health status of the blockchain nodes.
+
+    Raises
+    ------
+    NotInitializedError
+        If the blockchain nodes have not been initialized yet.
+
+    """
+    if _nodes_health_refresher is None:
+        return check_blockchain_nodes_health()
+    snapshot = _nodes_health_snapshot
+    if snapshot is not None and snapshot[0] == _blockchain_nodes_generation:
+        return snapshot[1]
+    return _refresh_nodes_health()
+
+
+def start_nodes_health_refresher(interval: float = 30.0) -> None:
+    """Start a background thread which periodically refreshes the
+    cached health status of the blockchain nodes. Nothing happens if
+    the background thread is already running.
+
+    Parameters
+    ----------
+    interval : float, optional
+        The interval (in seconds) for refreshing the health status of
+        the blockchain nodes (default: 30).
+
+    """
+    global _nodes_health_refresher, _nodes_health_refresher_stopped
+    with _nodes_health_lock:
+        if _nodes_health_refresher is not None:
+            return
+        _nodes_health_refresher_stopped = threading.Event()
+        _nodes_health_refresher = threading.Thread(
+            target=_refresh_nodes_health_periodically,
+            args=(interval, _nodes_health_refresher_stopped),
+            name='nodes-health-refresher', daemon=True)
+        _nodes_health_refresher.start()
+
+
+def stop_nodes_health_refresher() -> None:
+    """Stop the background thread which periodically refreshes the
+    cached health status of the blockchain nodes.
+
+    """
+    global _nodes_health_refresher, _nodes_health_refresher_stopped, \
+        _nodes_health_snapshot
+    with _nodes_health_lock:
+        nodes_health_refresher = _nodes_health_refresher
+        nodes_health_refresher_stopped = _nodes_health_refresher_stopped
+        _nodes_health_refresher = None
+        _nodes_health_refresher_stopped = None
+        _nodes_health_snapshot = None
+    if nodes_health_refresher_stopped is not None:
+        nodes_health_refresher_stopped.set()
+    if nodes_health_refresher is not None:
+        nodes_health_refresher.join()
+
+
 def initialize_blockchain_nodes(
     blockchain_nodes: dict[Blockchain, tuple[list[str],
                                              float | tuple | None]]) \
@@ -81,6 +194,33 @@ def initialize_blockchain_nodes(
         The blockchain nodes to be initialized.
 
     """
-    global _blockchain_nodes
+    global _blockchain_nodes, _blockchain_utilities, \
+        _blockchain_nodes_generation, _nodes_health_snapshot
     if _blockchain_nodes != blockchain_nodes:  # pragma: no cover
-        _blockchain_nodes = blockchain_nodes
+        with _nodes_health_lock:
+            _blockchain_nodes = blockchain_nodes
+            _blockchain_utilities = {}
+            # Health checks still in progress for the previous blockchain
+            # nodes must not be cached
+            _blockchain_nodes_generation += 1
+            _nodes_health_snapshot = None
+
+
+def _refresh_nodes_health() -> dict[Blockchain, NodesHealth]:
+    global _nodes_health_snapshot
+    generation = _blockchain_nodes_generation
+    nodes_health = check_blockchain_nodes_health()
+    with _nodes_health_lock:
+        if generation == _blockchain_nodes_generation:
+            _nodes_health_snapshot = (generation, nodes_health)
+    return nodes_health
+
+
+def _refresh_nodes_health_periodically(interval: float,
+                                       stopped: threading.Event) -> None:
+    while not stopped.wait(interval):
+        try:
+            _refresh_nodes_health()
+        except Exception:
+            _logger.error('unable to refresh the blockchain nodes health',
+                          exc_info=True)
@@ -18,8 +18,18 @@ _HUMAN_READABLE_LOG_FORMAT: typing.Final[str] = (
     '%(asctime)s - %(name)s - %(thread)d - %(levelname)s - '
     '%(message)s%(extra)s')
 
+_LOG_RECORD_ATTRIBUTES: typing.Final[frozenset[str]] = frozenset(
+    logging.LogRecord('', logging.NOTSET, '', 0, '', None,
+                      None).__dict__.keys() | {'asctime', 'message', 'extra'})
 
-@dataclasses.dataclass
+_JSON_CONVERTERS: typing.Final[dict[type, typing.Callable]] = {
+    datetime.datetime: datetime.datetime.isoformat,
+    Blockchain: lambda blockchain: blockchain.name_in_pascal_case
+}
+"""Converters of JSON log record attributes by their exact type."""
+
+
+@dataclasses.dataclass(slots=True)
 class LogFile:
     """Properties of a log file.
 
@@ -62,11 +72,10 @@ class LogFormat(enum.Enum):
             If no enumeration member can be found for the given name.
 
         """
-        name_upper = name.upper()
-        for log_format in LogFormat:
-            if name_upper == log_format.name:
-                return log_format
-        raise NameError(name)
+        try:
+            return LogFormat.__members__[name.upper()]
+        except KeyError:
+            raise NameError(name) from None
 
 
 class _DataDogJSONFormatter(json_log_formatter.VerboseJSONFormatter):
@@ -88,12 +97,10 @@ class _DataDogJSONFormatter(json_log_formatter.VerboseJSONFormatter):
             The mutated dictionary object of the log.
 
         """
-        for attribute_name in json_record:
-            attribute = json_record[attribute_name]
-            if isinstance(attribute, datetime.datetime):
-                json_record[attribute_name] = attribute.isoformat()
-            if isinstance(attribute, Blockchain):
-                json_record[attribute_name] = attribute.name_in_pascal_case
+        for attribute_name, attribute in json_record.items():
+            converter = _JSON_CONVERTERS.get(type(attribute))
+            if converter is not None:
+                json_record[attribute_name] = converter(attribute)
         return json_record
 
     def json_record(self, message: str, extra: typing.Dict[str | int,
@@ -118,7 +125,7 @@ class _DataDogJSONFormatter(json_log_formatter.VerboseJSONFormatter):
         """
         extra['levelname'] = record.levelname
         if 'time' not in extra:
-            extra['time'] = datetime.datetime.utcnow()
+            extra['time'] = datetime.datetime.now(datetime.UTC).isoformat()
         extra['message'] = message
         if record.exc_info:
             extra['exc_info'] = self.formatException(record.exc_info)
@@ -130,20 +137,14 @@ class _HumanReadableFormatter(logging.Formatter):
 
     """
     def __init__(self):
-        log_record = logging.LogRecord(None, None, None, None, None, None,
-                                       None)
-        self.__log_record_attributes = set(log_record.__dict__.keys())
-        self.__log_record_attributes.add('asctime')
-        self.__log_record_attributes.add('message')
         super().__init__(_HUMAN_READABLE_LOG_FORMAT)
 
     def format(self, log_record: logging.LogRecord) -> str:
         # Docstring inherited
-        extra = ''
-        for key, value in log_record.__dict__.items():
-            if key not in self.__log_record_attributes and key != 'extra':
-                extra += f' - {key}: {value}'
-        log_record.__dict__['extra'] = extra
+        log_record.__dict__['extra'] = ''.join([
+            f' - {key}: {value}' for key, value in log_record.__dict__.items()
+            if key not in _LOG_RECORD_ATTRIBUTES
+        ])
         return super().format(log_record)
 
 
@@ -177,12 +178,14 @@ def initialize_logger(logger: logging.Logger = logging.getLogger(),
 
     """
     logger.handlers.clear()
+    level = logging.DEBUG if debug else logging.INFO
     formatter = _create_formatter(log_format)
     if standard_output:
-        logger.addHandler(_create_standard_output_handler(formatter))
+        logger.addHandler(_create_standard_output_handler(formatter, level))
     if log_file is not None:
-        logger.addHandler(_create_rotating_file_handler(log_file, formatter))
-    logger.setLevel(logging.DEBUG if debug else logging.INFO)
+        logger.addHandler(
+            _create_rotating_file_handler(log_file, formatter, level))
+    logger.setLevel(level)
 
 
 def _create_formatter(log_format: LogFormat) -> logging.Formatter:
@@ -193,19 +196,26 @@ def _create_formatter(log_format: LogFormat) -> logging.Formatter:
     raise NotImplementedError
 
 
-def _create_rotating_file_handler(
-        log_file: LogFile, formatter: logging.Formatter) -> logging.Handler:
+def _create_rotating_file_handler(log_file: LogFile,
+                                  formatter: logging.Formatter,
+                                  level: int) -> logging.Handler:
     if not log_file.file_path.parent.exists():
         log_file.file_path.parent.mkdir(parents=True)
     handler = logging.handlers.RotatingFileHandler(
         log_file.file_path, maxBytes=log_file.max_bytes,
         backupCount=log_file.backup_count)
+    # Records propagated from descendant loggers are filtered before
+    # being formatted
+    handler.setLevel(level)
     handler.setFormatter(formatter)
     return handler
 
 
-def _create_standard_output_handler(
-        formatter: logging.Formatter) -> logging.Handler:
+def _create_standard_output_handler(formatter: logging.Formatter,
+                                    level: int) -> logging.Handler:
     handler = logging.StreamHandler(sys.stdout)
+    # Records propagated from descendant loggers are filtered before
+    # being formatted
+    handler.setLevel(level)
     handler.setFormatter(formatter)
     return handler
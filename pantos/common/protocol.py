@@ -10,6 +10,9 @@ _SUPPORTED_PROTOCOL_VERSIONS: typing.Final[set[semantic_version.Version]] = {
     semantic_version.Version('0.2.0')
 }
 
+_SORTED_SUPPORTED_PROTOCOL_VERSIONS: typing.Final[list[
+    semantic_version.Version]] = sorted(_SUPPORTED_PROTOCOL_VERSIONS)
+
 
 def get_latest_protocol_version() -> semantic_version.Version:
     """Get the latest supported Pantos protocol version.
@@ -20,7 +23,7 @@ def get_latest_protocol_version() -> semantic_version.Version:
         The protocol version.
 
     """
-    return max(_SUPPORTED_PROTOCOL_VERSIONS)
+    return _SORTED_SUPPORTED_PROTOCOL_VERSIONS[-1]
 
 
 def get_supported_protocol_versions() -> list[semantic_version.Version]:
@@ -32,7 +35,7 @@ def get_supported_protocol_versions() -> list[semantic_version.Version]:
         The protocol versions.
 
     """
-    return sorted(_SUPPORTED_PROTOCOL_VERSIONS)
+    return list(_SORTED_SUPPORTED_PROTOCOL_VERSIONS)
 
 
 def is_supported_protocol_version(version: semantic_version.Version) -> bool:
@@ -1,19 +1,45 @@
 """Common REST API resources.
 
 """
-import dataclasses
 import json
 import logging
+import typing
 
 import flask  # type: ignore
 import flask_restful  # type: ignore
+import werkzeug.exceptions
 
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
+from pantos.common.blockchains.enums import Blockchain
 from pantos.common.exceptions import NotInitializedError
 from pantos.common.health import check_blockchain_nodes_health
+from pantos.common.health import get_cached_blockchain_nodes_health
 
 _logger = logging.getLogger(__name__)
 """Logger for this module."""
 
+_BLOCKCHAIN_RESPONSE_NAMES: typing.Final[dict[Blockchain, str]] = {
+    blockchain: blockchain.name.capitalize()
+    for blockchain in Blockchain
+}
+"""Names of the blockchains used in REST API responses."""
+
+_NOT_INITIALIZED_RESPONSE_BODY: typing.Final[bytes] = json.dumps({
+    'message': 'no blockchain nodes have been initialized yet'
+}).encode()
+"""Response body if no blockchain nodes have been initialized yet."""
+
+_JSON_DUMPS_ARGUMENTS: typing.Final[dict[str, typing.Any]] = {
+    'ensure_ascii': False,
+    'separators': (',', ':'),
+    'sort_keys': True
+}
+"""Arguments for serializing JSON data like orjson (with sorted keys)."""
+
 
 class Live(flask_restful.Resource):
     """Flask resource class which specifies the health/live REST endpoint.
@@ -32,27 +58,49 @@ class NodesHealthResource(flask_restful.Resource):
 
     """
     def get(self):
-        """Return the health status of the blockchain nodes.
+        """Return the health status of the blockchain nodes. The
+        cached health status is returned unless a fresh one is
+        requested with the "fresh=1" query parameter.
 
         """
         try:
-            _logger.info('checking blockchain nodes health')
-            nodes_health = check_blockchain_nodes_health()
+            if flask.request.args.get('fresh') == '1':
+                _logger.debug('checking blockchain nodes health')
+                nodes_health = check_blockchain_nodes_health()
+            else:
+                nodes_health = get_cached_blockchain_nodes_health()
+            # The nodes health dataclass instances are directly
+            # serialized by the JSON library
             return ok_response({
-                blockchain.name.capitalize(): dataclasses.asdict(
-                    nodes_health[blockchain])
-                for blockchain in nodes_health
+                _BLOCKCHAIN_RESPONSE_NAMES[blockchain]: health
+                for blockchain, health in nodes_health.items()
             })
         except NotInitializedError:
             _logger.warning('no blockchain nodes have been initialized yet')
-            return internal_server_error(
-                'no blockchain nodes have been initialized yet')
+            # Avoid raising (and handling) an HTTPException for this
+            # known error
+            return flask.Response(_NOT_INITIALIZED_RESPONSE_BODY, status=500,
+                                  mimetype='application/json')
         except Exception:
             _logger.critical('cannot check blockchain nodes health',
                              exc_info=True)
             return internal_server_error()
 
 
+def _serialize_json(data: typing.Any) -> bytes | str:
+    if orjson is not None:
+        try:
+            # orjson directly produces UTF-8 encoded bytes
+            return orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+        except orjson.JSONEncodeError:
+            # For example, integers exceeding 64 bits or non-str keys
+            # are not supported
+            pass
+    # Serialize the data with the JSON provider of the current Flask
+    # application (if any), with the same output as orjson
+    return flask.json.dumps(data, **_JSON_DUMPS_ARGUMENTS)
+
+
 def ok_response(data: list | dict) -> flask.Response:
     """Create a Flask response given some data.
 
@@ -67,7 +115,7 @@ def ok_response(data: list | dict) -> flask.Response:
         The Flask response object.
 
     """
-    return flask.Response(json.dumps(data), status=200,
+    return flask.Response(_serialize_json(data), status=200,
                           mimetype='application/json')
 
 
@@ -99,7 +147,7 @@ def conflict(error_message: str):
         HTTP exception raised with the code 409.
 
     """
-    flask_restful.abort(409, message=error_message)
+    _abort(werkzeug.exceptions.Conflict, error_message)
 
 
 def not_acceptable(error_messages: str | list | dict):
@@ -116,7 +164,7 @@ def not_acceptable(error_messages: str | list | dict):
         HTTP exception raised with the code 406.
 
     """
-    flask_restful.abort(406, message=error_messages)
+    _abort(werkzeug.exceptions.NotAcceptable, error_messages)
 
 
 def bad_request(error_messages: str | list | dict):
@@ -133,7 +181,7 @@ def bad_request(error_messages: str | list | dict):
         HTTP exception raised with the code 400.
 
     """
-    flask_restful.abort(400, message=error_messages)
+    _abort(werkzeug.exceptions.BadRequest, error_messages)
 
 
 def forbidden(error_message: str):
@@ -150,7 +198,7 @@ def forbidden(error_message: str):
         HTTP exception raised with the code 403.
 
     """
-    flask_restful.abort(403, message=error_message)
+    _abort(werkzeug.exceptions.Forbidden, error_message)
 
 
 def resource_not_found(error_message: str):
@@ -167,7 +215,7 @@ def resource_not_found(error_message: str):
         HTTP exception raised with the code 404.
 
     """
-    flask_restful.abort(404, message=error_message)
+    _abort(werkzeug.exceptions.NotFound, error_message)
 
 
 def internal_server_error(error_message: str | None = None):
@@ -184,4 +232,13 @@ def internal_server_error(error_message: str | None = None):
         HTTP exception raised with the code 500.
 
     """
-    flask_restful.abort(500, message=error_message)
+    _abort(werkzeug.exceptions.InternalServerError, error_message)
+
+
+def _abort(exception_class: type[werkzeug.exceptions.HTTPException],
+           message: typing.Any) -> typing.NoReturn:
+    # Equivalent to flask_restful.abort without looking up the
+    # exception class by status code
+    exception = exception_class()
+    exception.data = {'message': message}  # type: ignore
+    raise exception
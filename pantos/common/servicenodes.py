@@ -1,11 +1,24 @@
 """Module for communicating with Pantos service nodes.
 
 """
+import concurrent.futures
 import dataclasses
+import functools
+import logging
+import operator
+import threading
 import typing
+import urllib.parse
 import uuid
+import weakref
 
 import requests
+import requests.adapters
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
 
 from pantos.common.blockchains.enums import Blockchain
 from pantos.common.entities import ServiceNodeBid
@@ -16,6 +29,23 @@ from pantos.common.types import BlockchainAddress
 _TRANSFER_RESOURCE = 'transfer'
 _STATUS_RESOURCE = 'status'
 _BID_RESOURCE = 'bids'
+_CONNECTION_POOL_SIZE = 32
+"""Maximum number of connections kept alive per service node host."""
+_JSON_REQUEST_HEADERS: typing.Final[dict[str, str]] = {
+    'Content-Type': 'application/json'
+}
+"""Headers for requests with a pre-serialized JSON body."""
+_get_bid_fields = operator.itemgetter('fee', 'execution_time', 'valid_until',
+                                      'signature')
+"""Getter for the ServiceNodeBid fields of a bid in a bids response."""
+
+_logger = logging.getLogger(__name__)
+"""Logger for this module."""
+
+_bids_executor = concurrent.futures.ThreadPoolExecutor(
+    max_workers=_CONNECTION_POOL_SIZE, thread_name_prefix='service-node-bids')
+"""Executor for retrieving the bids of multiple service nodes
+concurrently."""
 
 
 class ServiceNodeClientError(BaseError):
@@ -29,7 +59,7 @@ class ServiceNodeClient:
     """Client for communicating with Pantos service nodes.
 
     """
-    @dataclasses.dataclass
+    @dataclasses.dataclass(slots=True)
     class SubmitTransferRequest:
         """Request data for submitting a new token transfer request to a
         Pantos service node.
@@ -78,7 +108,7 @@ class ServiceNodeClient:
         valid_until: int
         signature: str
 
-    @dataclasses.dataclass
+    @dataclasses.dataclass(slots=True)
     class TransferStatusResponse:
         """Response data for checking the status of a transfer at a
         service node.
@@ -126,6 +156,38 @@ class ServiceNodeClient:
         transfer_id: int
         transaction_id: str
 
+    def __init__(self):
+        """Construct a service node client instance. The HTTP
+        connections to the service nodes are pooled and reused across
+        requests until the client is closed. Since requests sessions
+        are not guaranteed to be thread-safe, each thread using the
+        client gets its own session. A thread's session is closed when
+        the thread terminates.
+
+        """
+        self.__local = threading.local()
+        self.__sessions: weakref.WeakSet[requests.Session] = weakref.WeakSet()
+        self.__sessions_lock = threading.Lock()
+
+    def __enter__(self) -> 'ServiceNodeClient':
+        return self
+
+    def __exit__(self, *args: typing.Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the client's pooled HTTP connections to the service
+        nodes.
+
+        """
+        with self.__sessions_lock:
+            sessions = list(self.__sessions)
+            self.__sessions = weakref.WeakSet()
+            # Threads using the client afterwards get new sessions
+            self.__local = threading.local()
+        for session in sessions:
+            session.close()
+
     def submit_transfer(self, request: SubmitTransferRequest,
                         timeout: typing.Optional[float] = None) -> uuid.UUID:
         """Submit a new token transfer request to a Pantos service node.
@@ -165,16 +227,27 @@ class ServiceNodeClient:
             'valid_until': request.valid_until,
             'signature': request.signature
         }
+        post_arguments: dict[str, typing.Any] = {'json': service_node_request}
+        if orjson is not None:
+            try:
+                post_arguments = {
+                    'data': orjson.dumps(service_node_request),
+                    'headers': _JSON_REQUEST_HEADERS
+                }
+            except orjson.JSONEncodeError:
+                # For example, integers exceeding 64 bits are not
+                # supported
+                pass
         transfer_url = self.__build_transfer_url(request.service_node_url)
+        service_node_response = None
         try:
-            service_node_response = requests.post(transfer_url,
-                                                  json=service_node_request,
-                                                  timeout=timeout)
+            service_node_response = self.__get_session().post(
+                transfer_url, timeout=timeout, **post_arguments)
             # Raise an error in case of a 4xx or 5xx response status code
             service_node_response.raise_for_status()
             task_id = service_node_response.json()['task_id']
             return uuid.UUID(task_id)
-        except (requests.exceptions.RequestException, KeyError):
+        except (requests.exceptions.RequestException, ValueError, KeyError):
             response_message = self.__read_response_message(
                 service_node_response)
             raise ServiceNodeClientError(
@@ -213,17 +286,16 @@ class ServiceNodeClient:
         bids_url = self.__build_bids_url(service_node_url,
                                          str(source_blockchain.value),
                                          str(destination_blockchain.value))
+        service_node_response = None
         try:
-            service_node_response = requests.get(bids_url, timeout=timeout)
+            service_node_response = self.__get_session().get(
+                bids_url, timeout=timeout)
             service_node_response.raise_for_status()
             bids = service_node_response.json()
-            response = []
-            for bid in bids:
-                response.append(
-                    ServiceNodeBid(source_blockchain, destination_blockchain,
-                                   bid['fee'], bid['execution_time'],
-                                   bid['valid_until'], bid['signature']))
-            return response
+            return [
+                ServiceNodeBid(source_blockchain, destination_blockchain,
+                               *_get_bid_fields(bid)) for bid in bids
+            ]
         except (requests.exceptions.RequestException, ValueError, KeyError):
             response_message = self.__read_response_message(
                 service_node_response)
@@ -234,6 +306,48 @@ class ServiceNodeClient:
                 destination_blockchain=destination_blockchain,
                 response_message=response_message)
 
+    def bids_of_service_nodes(
+            self, service_node_urls: typing.Iterable[str],
+            source_blockchain: Blockchain, destination_blockchain: Blockchain,
+            timeout: typing.Optional[float] = None) \
+            -> dict[str, typing.List[ServiceNodeBid]]:
+        """Retrieve the bids of multiple service nodes concurrently.
+
+        Parameters
+        ----------
+        service_node_urls : iterable of str
+            The urls of the service nodes.
+        source_blockchain : Blockchain
+            The source blockchain of the bids.
+        destination_blockchain : Blockchain
+            The destination blockchain of the bids.
+        timeout : float, optional
+            The timeout (in seconds) for each service node request.
+
+        Returns
+        -------
+        dict[str, list of ServiceNodeBid]
+            The bids given by the service nodes (by service node url).
+            Service nodes whose bids cannot be retrieved are omitted.
+
+        """
+        future_to_service_node_url = {}
+        for service_node_url in service_node_urls:
+            future = _bids_executor.submit(self.bids, service_node_url,
+                                           source_blockchain,
+                                           destination_blockchain, timeout)
+            future_to_service_node_url[future] = service_node_url
+        service_node_bids = {}
+        for future in concurrent.futures.as_completed(
+                future_to_service_node_url):
+            service_node_url = future_to_service_node_url[future]
+            try:
+                service_node_bids[service_node_url] = future.result()
+            except ServiceNodeClientError:
+                _logger.warning('unable to get the bids of a service node',
+                                exc_info=True)
+        return service_node_bids
+
     def status(
             self, service_node_url: str, task_id: uuid.UUID,
             timeout: typing.Optional[float] = None) -> TransferStatusResponse:
@@ -258,8 +372,10 @@ class ServiceNodeClient:
 
         """
         status_url = self.__build_status_url(service_node_url, task_id)
+        service_node_response = None
         try:
-            service_node_response = requests.get(status_url, timeout=timeout)
+            service_node_response = self.__get_session().get(
+                status_url, timeout=timeout)
             service_node_response.raise_for_status()
             json_response = service_node_response.json()
             transfer_status_response = self.TransferStatusResponse(
@@ -282,30 +398,56 @@ class ServiceNodeClient:
                 service_node_url=service_node_url, task_id=task_id,
                 response_message=response_message)
 
-    def __build_transfer_url(self, service_node_url: str) -> str:
-        transfer_url = service_node_url
-        if not service_node_url.endswith('/'):
-            transfer_url += '/'
-        transfer_url += _TRANSFER_RESOURCE
-        return transfer_url
-
-    def __build_bids_url(self, service_node_url: str, source_blockchain: str,
+    def __get_session(self) -> requests.Session:
+        session = getattr(self.__local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=_CONNECTION_POOL_SIZE,
+                pool_maxsize=_CONNECTION_POOL_SIZE)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            # The session is only referenced by the thread-local data
+            # (which is released when the thread terminates), so its
+            # pooled connections must be closed when it is released
+            weakref.finalize(session, adapter.close)
+            with self.__sessions_lock:
+                self.__sessions.add(session)
+                self.__local.session = session
+        return session
+
+    @staticmethod
+    def __build_transfer_url(service_node_url: str) -> str:
+        return (_normalize_service_node_url(service_node_url) +
+                _TRANSFER_RESOURCE)
+
+    @staticmethod
+    def __build_bids_url(service_node_url: str, source_blockchain: str,
                          destination_blockchain: str) -> str:
-        bids_url = service_node_url
-        if not service_node_url.endswith('/'):
-            bids_url += '/'
-        return (f'{bids_url}{_BID_RESOURCE}?'
-                f'source_blockchain={source_blockchain}&'
-                f'destination_blockchain={destination_blockchain}')
-
-    def __build_status_url(self, service_node_url: str,
-                           task_id: uuid.UUID) -> str:
-        transfer_url = self.__build_transfer_url(service_node_url)
-        return f'{transfer_url}/{str(task_id)}/{_STATUS_RESOURCE}'
+        query = urllib.parse.urlencode({
+            'source_blockchain': source_blockchain,
+            'destination_blockchain': destination_blockchain
+        })
+        return (f'{_normalize_service_node_url(service_node_url)}'
+                f'{_BID_RESOURCE}?{query}')
+
+    @staticmethod
+    def __build_status_url(service_node_url: str, task_id: uuid.UUID) -> str:
+        transfer_url = ServiceNodeClient.__build_transfer_url(service_node_url)
+        return f'{transfer_url}/{task_id}/{_STATUS_RESOURCE}'
 
     def __read_response_message(
-            self, response: requests.Response) -> typing.Optional[str]:
+            self, response: typing.Optional[requests.Response]
+    ) -> typing.Optional[str]:
+        # There is no response in case of connection errors or timeouts
+        if response is None:
+            return None
         response_message = None
         if 'application/json' in response.headers.get('content-type', ''):
             response_message = response.json().get('message')
         return response_message
+
+
+@functools.lru_cache(maxsize=256)
+def _normalize_service_node_url(service_node_url: str) -> str:
+    return service_node_url.rstrip('/') + '/'
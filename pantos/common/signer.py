@@ -1,9 +1,28 @@
-import getpass
+import collections
+import hashlib
+import threading
 import typing
 
 import Crypto.PublicKey.ECC
 import Crypto.Signature.eddsa
 
+try:
+    import nacl.exceptions  # type: ignore
+    import nacl.signing  # type: ignore
+except ImportError:  # pragma: no cover
+    nacl = None  # type: ignore
+
+_VERIFICATION_CACHE_SIZE = 4096
+"""Maximum number of cached verification results per signer."""
+
+_VERIFICATION_CACHE_DIGEST_SIZE = 32
+"""Size (in bytes) of the hash digests used as verification cache keys."""
+
+_INVALID_SIGNATURE_ERRORS: tuple[type[Exception], ...] = (ValueError, )
+"""Errors raised by the signature schemes for invalid signatures."""
+if nacl is not None:
+    _INVALID_SIGNATURE_ERRORS += (nacl.exceptions.BadSignatureError, )
+
 
 class SignerError(Exception):
     """Exception class for signer errors.
@@ -26,7 +45,31 @@ class SignerError(Exception):
         super().__init__(message, name, **kwargs)
 
 
+class _NaclEdDSASigScheme:
+    """EdDSA signature scheme for Ed25519 keys backed by libsodium
+    (via PyNaCl). It produces the same signatures as the RFC 8032
+    scheme of PyCryptodome.
+
+    """
+    __slots__ = ('__signing_key', '__verify_key')
+
+    def __init__(self, seed: bytes):
+        self.__signing_key = nacl.signing.SigningKey(seed)
+        self.__verify_key = self.__signing_key.verify_key
+
+    def sign(self, message: bytes) -> bytes:
+        return self.__signing_key.sign(message).signature
+
+    def verify(self, message: bytes, signature: bytes) -> None:
+        # Raises BadSignatureError (without being translated to
+        # ValueError to avoid raising a second exception)
+        self.__verify_key.verify(message, signature)
+
+
 class _Signer:
+    __slots__ = ('__signer', '__verification_cache',
+                 '__verification_cache_lock')
+
     def __init__(self, pem_value: str, pem_password: str):
         """
         Constructor of Signer class.
@@ -40,14 +83,19 @@ class _Signer:
 
         """
         self.__signer = self._load_signer(pem_value, pem_password)
+        # Verifying the same message and signature always gives the
+        # same result
+        self.__verification_cache: collections.OrderedDict[
+            bytes, bool] = collections.OrderedDict()
+        self.__verification_cache_lock = threading.Lock()
 
-    def sign_message(self, message: str) -> str:
+    def sign_message(self, message: str | bytes) -> str:
         """Sign a message.
 
         Parameters
         ----------
-        message : str
-            The message to be signed.
+        message : str or bytes
+            The message to be signed (UTF-8 encoded if given as str).
 
         Returns
         -------
@@ -59,25 +107,49 @@ class _Signer:
         SignerError
             If the message cannot be signed.
 
+        """
+        return self.sign_message_raw(message).hex()
+
+    def sign_message_raw(self, message: str | bytes) -> bytes:
+        """Sign a message and return the raw signature bytes (e.g. to
+        avoid hex-encoding the signature for internal use).
+
+        Parameters
+        ----------
+        message : str or bytes
+            The message to be signed (UTF-8 encoded if given as str).
+
+        Returns
+        -------
+        bytes
+            The signature of the message.
+
+        Raises
+        ------
+        SignerError
+            If the message cannot be signed.
+
         """
         try:
-            message_bytes = message.encode()
-            signature = self.__signer.sign(message_bytes)
-            return signature.hex()
+            message_bytes = (message if isinstance(message, bytes) else
+                             message.encode())
+            return self.__signer.sign(message_bytes)
         except Exception:
-            raise SignerError(
-                f'unable to compute signature of message: {message}')
+            formatted_message = _format_message(message)
+            raise SignerError('unable to compute signature of message: '
+                              f'{formatted_message}')
 
-    def verify_message(self, message: str, signature: str) -> bool:
+    def verify_message(self, message: str | bytes,
+                       signature: str | bytes) -> bool:
         """Verify that the message is valid (signed by the same
         private key).
 
         Parameters
         ----------
-        message : str
-            The message to be verified.
-        signature : str
-            The signature of the message.
+        message : str or bytes
+            The message to be verified (UTF-8 encoded if given as str).
+        signature : str or bytes
+            The signature of the message (hex-encoded if given as str).
 
         Returns
         -------
@@ -91,15 +163,45 @@ class _Signer:
 
         """
         try:
-            message_bytes = message.encode()
-            try:
-                self.__signer.verify(message_bytes, bytes.fromhex(signature))
-                return True
-            except ValueError:
-                return False
+            return self.__verify(message, signature)
         except Exception:
-            raise SignerError(
-                f'unable to verify signature of message {message}')
+            formatted_message = _format_message(message)
+            raise SignerError('unable to verify signature of message '
+                              f'{formatted_message}')
+
+    def verify_messages(
+        self, messages: typing.Iterable[tuple[str | bytes,
+                                              str | bytes]]) -> list[bool]:
+        """Verify that multiple messages are valid (signed by the same
+        private key).
+
+        Parameters
+        ----------
+        messages : iterable of tuple[str or bytes, str or bytes]
+            The messages to be verified, each together with its
+            signature (see verify_message).
+
+        Returns
+        -------
+        list[bool]
+            If the signatures of the messages are valid (in the same
+            order as the messages).
+
+        Raises
+        ------
+        SignerError
+            If any of the messages cannot be verified.
+
+        """
+        results = []
+        for message, signature in messages:
+            try:
+                results.append(self.__verify(message, signature))
+            except Exception:
+                formatted_message = _format_message(message)
+                raise SignerError('unable to verify signature of message '
+                                  f'{formatted_message}')
+        return results
 
     def build_message(self, separator: str = '', *message_parts:
                       typing.Any) -> str:
@@ -119,17 +221,57 @@ class _Signer:
             The built message.
 
         """
-        message = ''
-        for message_part in message_parts:
-            message += f'{str(message_part)}{separator}'
-        # cutting of last separator
-        return message[:-1]
+        if not message_parts:
+            return ''
+        # Each part is followed by the separator and the last character
+        # is cut off (messages must stay the same for their signatures
+        # to be verifiable by all nodes)
+        return (separator.join(map(str, message_parts)) + separator)[:-1]
+
+    def __verify(self, message: str | bytes, signature: str | bytes) -> bool:
+        message_bytes = (message
+                         if isinstance(message, bytes) else message.encode())
+        try:
+            signature_bytes = (signature if isinstance(signature, bytes) else
+                               bytes.fromhex(signature))
+        except ValueError:
+            return False
+        return self.__verify_bytes(message_bytes, signature_bytes)
+
+    def __verify_bytes(self, message: bytes, signature: bytes) -> bool:
+        # Key the cache on a fixed-size digest so that arbitrarily
+        # large messages and signatures are not kept in memory
+        hash_ = hashlib.blake2b(digest_size=_VERIFICATION_CACHE_DIGEST_SIZE)
+        hash_.update(len(signature).to_bytes(8, 'big'))
+        hash_.update(signature)
+        hash_.update(message)
+        cache_key = hash_.digest()
+        with self.__verification_cache_lock:
+            result = self.__verification_cache.get(cache_key)
+            if result is not None:
+                self.__verification_cache.move_to_end(cache_key)
+                return result
+        result = self.__verify_bytes_uncached(message, signature)
+        with self.__verification_cache_lock:
+            self.__verification_cache[cache_key] = result
+            if len(self.__verification_cache) > _VERIFICATION_CACHE_SIZE:
+                self.__verification_cache.popitem(last=False)
+        return result
+
+    def __verify_bytes_uncached(self, message: bytes,
+                                signature: bytes) -> bool:
+        try:
+            self.__signer.verify(message, signature)
+            return True
+        except _INVALID_SIGNATURE_ERRORS:
+            return False
 
     def _load_signer(
-            self, pem_value: str,
-            pem_password: str) -> Crypto.Signature.eddsa.EdDSASigScheme:
+        self, pem_value: str, pem_password: str
+    ) -> Crypto.Signature.eddsa.EdDSASigScheme | _NaclEdDSASigScheme:
         """Load the EdDSA signer object from a password-encrypted pem file.
-        The key must be on the curve Ed25519 or Ed448.
+        The key must be on the curve Ed25519 or Ed448. Ed25519 keys are
+        handled by PyNaCl if it is installed.
 
         Parameters
         ----------
@@ -140,7 +282,7 @@ class _Signer:
 
         Returns
         -------
-        Crypto.Signature.eddsa.EdDSASigScheme
+        Crypto.Signature.eddsa.EdDSASigScheme or _NaclEdDSASigScheme
             An EdDSA signature object.
 
         Raises
@@ -151,11 +293,13 @@ class _Signer:
         """
         try:
             if pem_password is None:
-                pem_password = getpass.getpass(
-                    'Password for decrypting the pem file')
-
+                # Never prompt for the password since that would block
+                # servers and workers
+                raise SignerError('the PEM password is required')
             private_key = Crypto.PublicKey.ECC.import_key(
                 pem_value, passphrase=pem_password)
+            if nacl is not None and private_key.curve == 'Ed25519':
+                return _NaclEdDSASigScheme(private_key.seed)  # type: ignore
             return Crypto.Signature.eddsa.new(private_key,
                                               'rfc8032')  # type: ignore
         except SignerError:
@@ -164,18 +308,31 @@ class _Signer:
             raise SignerError('cannot load the private key')
 
 
-_signer: typing.Optional[_Signer] = None
+def _format_message(message: str | bytes) -> str:
+    # Keep str messages unchanged in error messages (bytes messages
+    # are shown by their representation)
+    return repr(message) if isinstance(message, bytes) else str(message)
+
+
+_signer_cache: dict[bytes, _Signer] = {}
+"""Cache of the loaded signers (by hash digest of their PEM value)."""
+
+_signer_cache_lock = threading.Lock()
+"""Lock for loading and caching the signers."""
 
 
 def get_signer(pem_value: str, pem_password: str) -> _Signer:
-    """Get a _Signer object.
+    """Get a _Signer object. The signer for a PEM value is loaded only
+    once and reused afterwards. It can be shared across threads since
+    signing and verifying messages do not modify its state.
 
     Parameters
     ----------
     pem_value : str
         Value of the encrypted private key.
     pem_password : str
-        Password to unlock the PEM file.
+        Password to unlock the PEM file. It must be provided by the
+        caller since it is never prompted for.
 
     Returns
     -------
@@ -188,7 +345,14 @@ def get_signer(pem_value: str, pem_password: str) -> _Signer:
         If the signer cannot be gotten.
 
     """
-    global _signer
-    if not _signer:
-        _signer = _Signer(pem_value, pem_password)
-    return _signer
+    cache_key = hashlib.blake2b(pem_value.encode(), digest_size=16).digest()
+    signer = _signer_cache.get(cache_key)
+    if signer is not None:
+        return signer
+    # Make sure that each PEM value is loaded (decrypted) only once
+    with _signer_cache_lock:
+        signer = _signer_cache.get(cache_key)
+        if signer is None:
+            signer = _Signer(pem_value, pem_password)
+            _signer_cache[cache_key] = signer
+    return signer
@@ -7,15 +7,15 @@ import typing
 
 
 class BlockchainAddress(str):
-    pass
+    __slots__ = ()
 
 
 class PrivateKey(str):
-    pass
+    __slots__ = ()
 
 
 class TokenSymbol(str):
-    pass
+    __slots__ = ()
 
 
 AccountId = typing.Union[BlockchainAddress, PrivateKey]
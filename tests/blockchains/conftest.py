@@ -1,7 +1,5 @@
-import atexit
 import dataclasses
 import pathlib
-import tempfile
 import uuid
 
 import pytest
@@ -33,7 +31,10 @@ _BLOCKCHAIN_NODE_URL = 'https://some.url'
 
 _FALLBACK_BLOCKCHAIN_NODE_URL = 'https://some2.url'
 
-_INACTIVE_BLOCKCHAINS = [Blockchain.SOLANA]
+_INACTIVE_BLOCKCHAINS = frozenset({Blockchain.SOLANA})
+
+_ACTIVE_BLOCKCHAINS = tuple(blockchain for blockchain in Blockchain
+                            if blockchain not in _INACTIVE_BLOCKCHAINS)
 
 _REQUIRED_TRANSACTION_CONFIRMATIONS = 20
 
@@ -71,31 +72,29 @@ class Account:
     private_key: str
     keystore: str
     keystore_password: str
-    keystore_path: pathlib.Path = dataclasses.field(init=False)
-
-    def __post_init__(self):
-        self.keystore_path = pathlib.Path(tempfile.mkstemp()[1])
-        with self.keystore_path.open('w') as keystore_file:
-            keystore_file.write(self.keystore)
-        atexit.register(self.keystore_path.unlink)
+    keystore_path: pathlib.Path
 
 
 @pytest.fixture(scope='package')
-def account():
+def account(tmp_path_factory):
+    # The temporary directory is removed by pytest
+    keystore_path = tmp_path_factory.mktemp('account') / 'keystore'
+    keystore_path.write_text(_ACCOUNT_KEYSTORE)
     return Account(_ACCOUNT_ADDRESS, _ACCOUNT_PRIVATE_KEY, _ACCOUNT_KEYSTORE,
-                   _ACCOUNT_KEYSTORE_PASSWORD)
+                   _ACCOUNT_KEYSTORE_PASSWORD, keystore_path)
+
+
+def _enum_member_id(enum_member):
+    return enum_member.name
 
 
-@pytest.fixture(scope='package', params=Blockchain)
+@pytest.fixture(scope='package', params=Blockchain, ids=_enum_member_id)
 def blockchain(request):
     return request.param
 
 
-@pytest.fixture(
-    scope='package', params=[
-        blockchain for blockchain in Blockchain
-        if blockchain not in _INACTIVE_BLOCKCHAINS
-    ])
+@pytest.fixture(scope='package', params=_ACTIVE_BLOCKCHAINS,
+                ids=_enum_member_id)
 def active_blockchain(request):
     return request.param
 
@@ -186,7 +185,7 @@ def transaction_adaptable_fee_per_gas():
     return _TRANSACTION_ADAPTABLE_FEE_PER_GAS
 
 
-@pytest.fixture(scope='package', params=ContractAbi)
+@pytest.fixture(scope='package', params=ContractAbi, ids=_enum_member_id)
 def versioned_contract_abi(request, protocol_version):
     return VersionedContractAbi(request.param, protocol_version)
 
@@ -1,4 +1,5 @@
-import dataclasses
+import copy
+import functools
 import importlib
 import json
 import pathlib
@@ -6,6 +7,8 @@ import unittest.mock
 import uuid
 
 import pytest
+import web3
+import web3.eth
 
 from pantos.common.blockchains.base import _BASE_CONTRACT_ABI_PACKAGE
 from pantos.common.blockchains.base import BlockchainUtilities
@@ -51,13 +54,29 @@ _CONTRACT_ABI = '''
     ]
 '''
 
+_CONTRACT_ABI_LIST = json.loads(_CONTRACT_ABI)
 
-@pytest.fixture
+_ABI_FILE_NAME = f'{uuid.uuid4()}.abi'
+
+_FIRST_CONTRACT_ABI = next(iter(ContractAbi))
+
+
+@functools.lru_cache(maxsize=None)
+def _get_contract_abi_package_dir(protocol_version):
+    module_to_import = (
+        f'{_BASE_CONTRACT_ABI_PACKAGE}.v{protocol_version.major}_'
+        f'{protocol_version.minor}_{protocol_version.patch}')
+    module = importlib.import_module(module_to_import)
+    return pathlib.Path(module.__file__).parent
+
+
+@pytest.fixture(scope='module')
 @unittest.mock.patch.object(BlockchainUtilities, '__abstractmethods__', set())
-def blockchain_utilities(blockchain_node_urls, fallback_blockchain_node_urls,
-                         average_block_time,
-                         required_transaction_confirmations,
-                         transaction_network_id, account):
+def shared_blockchain_utilities(blockchain_node_urls,
+                                fallback_blockchain_node_urls,
+                                average_block_time,
+                                required_transaction_confirmations,
+                                transaction_network_id, account):
     return BlockchainUtilities(
         blockchain_node_urls, fallback_blockchain_node_urls,
         average_block_time, required_transaction_confirmations,
@@ -66,6 +85,18 @@ def blockchain_utilities(blockchain_node_urls, fallback_blockchain_node_urls,
         celery_tasks_enabled=True)
 
 
+@pytest.fixture
+def blockchain_utilities(shared_blockchain_utilities):
+    # Tests may modify the instance (including its contract ABI cache),
+    # so each test gets its own shallow copy (copying creates a new
+    # instance of the abstract class)
+    with unittest.mock.patch.object(BlockchainUtilities, '__abstractmethods__',
+                                    set()):
+        blockchain_utilities = copy.copy(shared_blockchain_utilities)
+    blockchain_utilities._BlockchainUtilities__loaded_contract_abis = {}
+    return blockchain_utilities
+
+
 @pytest.mark.parametrize('celery_tasks_enabled', [True, False])
 @unittest.mock.patch.object(BlockchainUtilities, 'decrypt_private_key')
 @unittest.mock.patch.object(BlockchainUtilities, 'get_address')
@@ -152,9 +183,14 @@ def test_create_node_connection_fallback_not_used_twice_correct(
     blockchain_utilities._fallback_blockchain_node_urls = [
         'fallback_node1', 'fallback_node2'
     ]
+
+    def create_single_node_connection(node_url, _):
+        if node_url.startswith('fallback'):
+            return node_url
+        raise SingleNodeConnectionError()
+
     mocked_create_single_node_connection.side_effect = \
-        lambda node_url, _: node_url if node_url.startswith('fallback') \
-        else exec('raise SingleNodeConnectionError()')
+        create_single_node_connection
 
     node_connections = blockchain_utilities.create_node_connections()
 
@@ -187,20 +223,14 @@ def test_create_node_connection_no_node_connection_valid(
         blockchain_utilities.create_node_connections()
 
 
-@unittest.mock.patch.object(ContractAbi, 'get_file_name')
+@unittest.mock.patch.object(ContractAbi, 'get_file_name',
+                            return_value=_ABI_FILE_NAME)
 def test_load_contract_abi_correct(mock_get_file_name, blockchain_utilities,
                                    protocol_version):
-    abi_file_name = f'{uuid.uuid4()}.abi'
-    mock_get_file_name.return_value = abi_file_name
-    module_to_import = (
-        f'{_BASE_CONTRACT_ABI_PACKAGE}.v{protocol_version.major}_'
-        f'{protocol_version.minor}_{protocol_version.patch}')
-    module = importlib.import_module(module_to_import)
-    abi_file_path = pathlib.Path(module.__file__).parent / abi_file_name
-    contract_abi = list(ContractAbi)[0]
-    versioned_contract_abi = VersionedContractAbi(contract_abi,
+    abi_file_path = (_get_contract_abi_package_dir(protocol_version) /
+                     _ABI_FILE_NAME)
+    versioned_contract_abi = VersionedContractAbi(_FIRST_CONTRACT_ABI,
                                                   protocol_version)
-    contract_abi_list = json.loads(_CONTRACT_ABI)
     try:
         with abi_file_path.open('w') as abi_file:
             abi_file.write(_CONTRACT_ABI)
@@ -208,23 +238,23 @@ def test_load_contract_abi_correct(mock_get_file_name, blockchain_utilities,
             versioned_contract_abi)
     finally:
         abi_file_path.unlink()
-    assert loaded_contract_abi_list == contract_abi_list
+    assert loaded_contract_abi_list == _CONTRACT_ABI_LIST
     # Make sure that a cached version is returned when the function is
     # invoked again (loading the ABI again from the file would fail
     # since the file has already been deleted)
     loaded_contract_abi_list = blockchain_utilities.load_contract_abi(
         versioned_contract_abi)
-    assert loaded_contract_abi_list == contract_abi_list
+    assert loaded_contract_abi_list == _CONTRACT_ABI_LIST
 
 
 @unittest.mock.patch.object(ContractAbi, 'get_file_name',
-                            return_value=f'{uuid.uuid4()}.abi')
+                            return_value=_ABI_FILE_NAME)
 @unittest.mock.patch.object(BlockchainUtilities, 'get_error_class',
                             return_value=BlockchainUtilitiesError)
 def test_load_contract_abi_error(mock_get_error_class, mock_get_file_name,
                                  blockchain_utilities, protocol_version):
-    versioned_contract_abi = VersionedContractAbi(
-        list(ContractAbi)[0], protocol_version)
+    versioned_contract_abi = VersionedContractAbi(_FIRST_CONTRACT_ABI,
+                                                  protocol_version)
     with pytest.raises(BlockchainUtilitiesError):
         blockchain_utilities.load_contract_abi(versioned_contract_abi)
 
@@ -239,15 +269,19 @@ def test_load_contract_abi_file_existence(blockchain_utilities,
     assert len(contract_abi) > 0
 
 
-@pytest.mark.parametrize('underpriced_submissions', [0, 1, 10])
-@pytest.mark.parametrize('min_adaptable_fee_per_gas', [0, int(1e6), int(1e9)])
+# Expected minimum adaptable fees per gas of all submissions (with an
+# adaptable fee increase factor of 1.101)
+@pytest.mark.parametrize('min_adaptable_fee_per_gas, expected_fees_per_gas',
+                         [(0, [1]), (0, [1, 2, 3, 4]), (7, [8, 9, 10]),
+                          (int(1e6), [1101000, 1212201]),
+                          (int(1e9), [1101000000, 1212201000, 1334633301])])
 @unittest.mock.patch.object(BlockchainUtilities, 'submit_transaction')
-def test_resubmit_transaction_correct(mock_submit_transaction,
-                                      min_adaptable_fee_per_gas,
-                                      underpriced_submissions,
-                                      blockchain_utilities,
-                                      transaction_resubmission_request,
-                                      transaction_submission_response):
+def test_resubmit_transaction_correct(
+        mock_submit_transaction, min_adaptable_fee_per_gas,
+        expected_fees_per_gas, blockchain_utilities,
+        transaction_resubmission_request, transaction_submission_response,
+        transaction_resubmission_response):
+    underpriced_submissions = len(expected_fees_per_gas) - 1
     mock_submit_transaction.side_effect = (
         [TransactionUnderpricedError] * underpriced_submissions +
         [transaction_submission_response])
@@ -255,9 +289,11 @@ def test_resubmit_transaction_correct(mock_submit_transaction,
         min_adaptable_fee_per_gas
     response = blockchain_utilities.resubmit_transaction(
         transaction_resubmission_request)
-    assert dataclasses.asdict(response) == dataclasses.asdict(
-        transaction_submission_response)
-    assert mock_submit_transaction.call_count == underpriced_submissions + 1
+    assert response == transaction_resubmission_response
+    assert [
+        call.args[0].min_adaptable_fee_per_gas
+        for call in mock_submit_transaction.call_args_list
+    ] == expected_fees_per_gas
 
 
 @unittest.mock.patch.object(BlockchainUtilities, 'get_error_class',
@@ -416,8 +452,21 @@ def test_get_transaction_submission_status_transaction_resubmission_task_error(
             internal_transaction_id)
 
 
-def test_add_node_connections_correct():
-    mock_connection = unittest.mock.Mock()
+@pytest.fixture(scope='module')
+def mock_connection_factory():
+    def create_mock_connection():
+        mock_connection = unittest.mock.create_autospec(
+            web3.Web3, instance=True)
+        # The Eth module's methods cannot be autospecced outside of a
+        # Web3 instance
+        mock_connection.eth = unittest.mock.Mock(spec=dir(web3.eth.Eth))
+        return mock_connection
+
+    return create_mock_connection
+
+
+def test_add_node_connections_correct(mock_connection_factory):
+    mock_connection = mock_connection_factory()
     node_connections = NodeConnections()
 
     node_connections.add_node_connection(mock_connection)
@@ -432,19 +481,19 @@ def test_getattr_with_no_connections_error():
     node_connections = NodeConnections()
 
     with pytest.raises(NodeConnectionError):
-        node_connections.attribute
+        node_connections.eth
 
 
-def test_getattr_with_valid_connection_correct():
-    mock_connection = unittest.mock.Mock()
+def test_getattr_with_valid_connection_correct(mock_connection_factory):
+    mock_connection = mock_connection_factory()
     node_connections = NodeConnections()
     node_connections.add_node_connection(mock_connection)
 
-    assert isinstance(node_connections.attribute, NodeConnections.Wrapper)
+    assert isinstance(node_connections.eth, NodeConnections.Wrapper)
 
 
-def test_call_non_transaction_function_correct():
-    mock_connection = unittest.mock.Mock()
+def test_call_non_transaction_function_correct(mock_connection_factory):
+    mock_connection = mock_connection_factory()
     node_connections = NodeConnections()
     node_connections.add_node_connection(mock_connection)
     wrapper = node_connections.eth.get_balance
@@ -452,8 +501,8 @@ def test_call_non_transaction_function_correct():
     assert not wrapper._Wrapper__is_transaction_function
 
 
-def test_call_transaction_function():
-    mock_connection = unittest.mock.Mock()
+def test_call_transaction_function(mock_connection_factory):
+    mock_connection = mock_connection_factory()
     node_connections = NodeConnections(['send_transaction'])
     node_connections.add_node_connection(mock_connection)
     wrapper = node_connections.eth.send_transaction
@@ -463,59 +512,59 @@ def test_call_transaction_function():
     assert result == wrapper._Wrapper__objects[0]()
 
 
-def test_get_wrapper_attribute_result_correct():
-    mock_connection = unittest.mock.Mock()
-    mock_connection.eth.get_gas = 100
+def test_get_wrapper_attribute_result_correct(mock_connection_factory):
+    mock_connection = mock_connection_factory()
+    mock_connection.eth.gas_price = 100
     node_connections = NodeConnections()
     node_connections.add_node_connection(mock_connection)
-    result = node_connections.eth.get_gas.get()
+    result = node_connections.eth.gas_price.get()
 
     assert result == 100
 
 
-def test_get_item_correct():
-    mock_connection = unittest.mock.Mock()
-    mock_connection.accounts = ['account']
+def test_get_item_correct(mock_connection_factory):
+    mock_connection = mock_connection_factory()
+    mock_connection.eth.accounts = ['account']
     node_connections = NodeConnections()
     node_connections.add_node_connection(mock_connection)
 
-    account_wrapped = node_connections.accounts[0]
+    account_wrapped = node_connections.eth.accounts[0]
 
     assert account_wrapped._Wrapper__objects[0] == 'account'
 
 
-def test_compare_results_matching_correct():
-    mock_connection = unittest.mock.Mock()
-    mock_connection.get_balance.return_value = 10
+def test_compare_results_matching_correct(mock_connection_factory):
+    mock_connection = mock_connection_factory()
+    mock_connection.eth.get_balance.return_value = 10
     node_connections = NodeConnections()
     node_connections.add_node_connection(mock_connection)
     node_connections.add_node_connection(mock_connection)
 
-    balance = node_connections.get_balance().get()
+    balance = node_connections.eth.get_balance().get()
 
     assert balance == 10
 
 
-def test_compare_results_not_matching_error():
-    mock_connection = unittest.mock.Mock()
-    mock_connection_2 = unittest.mock.Mock()
-    mock_connection.get_balance.return_value = 10
-    mock_connection_2.get_balance.return_value = 15
+def test_compare_results_not_matching_error(mock_connection_factory):
+    mock_connection = mock_connection_factory()
+    mock_connection_2 = mock_connection_factory()
+    mock_connection.eth.get_balance.return_value = 10
+    mock_connection_2.eth.get_balance.return_value = 15
     node_connections = NodeConnections()
     node_connections.add_node_connection(mock_connection)
     node_connections.add_node_connection(mock_connection_2)
 
     with pytest.raises(ResultsNotMatchingError):
-        node_connections.get_balance().get()
+        node_connections.eth.get_balance().get()
 
 
-def test_get_minimum_result_correct():
-    mock_connection = unittest.mock.Mock()
-    mock_connection_2 = unittest.mock.Mock()
-    mock_connection.get_block_number.return_value = 10
-    mock_connection_2.get_block_number.return_value = 11
+def test_get_minimum_result_correct(mock_connection_factory):
+    mock_connection = mock_connection_factory()
+    mock_connection_2 = mock_connection_factory()
+    mock_connection.eth.get_block_number.return_value = 10
+    mock_connection_2.eth.get_block_number.return_value = 11
     node_connections = NodeConnections()
     node_connections.add_node_connection(mock_connection)
     node_connections.add_node_connection(mock_connection_2)
 
-    assert node_connections.get_block_number().get_minimum_result() == 10
+    assert node_connections.eth.get_block_number().get_minimum_result() == 10
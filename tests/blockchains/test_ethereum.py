@@ -1,3 +1,5 @@
+import dataclasses
+import functools
 import importlib.resources
 import unittest.mock
 
@@ -37,6 +39,13 @@ _ERC20_CONTRACT_BYTECODE = 'ethereum_erc20.bytecode'
 """File name of the ERC20 token contract bytecode."""
 
 
+@functools.lru_cache(maxsize=None)
+def _read_contract_file(file_name):
+    with importlib.resources.open_text(_CONTRACT_ABI_PACKAGE,
+                                       file_name) as contract_file:
+        return contract_file.read()
+
+
 @pytest.fixture(scope='module')
 def w3():
     return web3.Web3(web3.EthereumTesterProvider())
@@ -67,14 +76,26 @@ def ethereum_utilities(mock_create_node_connections, blockchain_node_urls,
 
 
 @pytest.fixture
+def mocked_node_connections():
+    return unittest.mock.Mock()
+
+
+@pytest.fixture
+def reverted_transaction(w3, contract_address):
+    return {
+        'from': w3.eth.accounts[0],
+        'to': contract_address,
+        'value': 0,
+        'input': "",
+        'blockNumber': 1,
+    }
+
+
+@pytest.fixture(scope='module')
 def deployed_erc20(w3, node_connections):
     default_account = w3.eth.accounts[0]
-    with importlib.resources.open_text(
-            _CONTRACT_ABI_PACKAGE, _ERC20_CONTRACT_BYTECODE) as bytecode_file:
-        bytecode = bytecode_file.read()
-    with importlib.resources.open_text(_CONTRACT_ABI_PACKAGE,
-                                       _ERC20_CONTRACT_ABI) as abi_file:
-        erc20_abi = abi_file.read()
+    bytecode = _read_contract_file(_ERC20_CONTRACT_BYTECODE)
+    erc20_abi = _read_contract_file(_ERC20_CONTRACT_ABI)
     erc20_contract = node_connections.eth.contract(abi=erc20_abi,
                                                    bytecode=bytecode)
     tx_hash = erc20_contract.constructor(1000, 'TOK', 2, 'TOK').transact(
@@ -126,9 +147,9 @@ def test_get_coin_balance_wrong_address_raises_error(ethereum_utilities):
         ethereum_utilities.get_balance('0x0')
 
 
-def test_get_coin_balance_error(ethereum_utilities, w3):
+def test_get_coin_balance_error(ethereum_utilities, w3,
+                                mocked_node_connections):
     default_account = w3.eth.accounts[0]
-    mocked_node_connections = unittest.mock.Mock()
     mocked_node_connections.eth.get_balance.side_effect = \
         Exception
 
@@ -137,9 +158,9 @@ def test_get_coin_balance_error(ethereum_utilities, w3):
             default_account, node_connections=mocked_node_connections)
 
 
-def test_get_coin_balance_results_not_matching_error(ethereum_utilities, w3):
+def test_get_coin_balance_results_not_matching_error(ethereum_utilities, w3,
+                                                     mocked_node_connections):
     default_account = w3.eth.accounts[0]
-    mocked_node_connections = unittest.mock.Mock()
     mocked_node_connections.eth.get_balance.side_effect = \
         ResultsNotMatchingError
 
@@ -187,26 +208,25 @@ def test_get_logs_error(ethereum_utilities, deployed_erc20):
         ethereum_utilities.get_logs(transfer_event, 0, 1000)
 
 
-def test_is_valid_address(ethereum_utilities):
-    # Valid Ethereum checksum addresses
-    assert ethereum_utilities.is_valid_address(
-        '0x2F64230f0AFFCA54563958caF89c9710f132cFe3')
-    assert ethereum_utilities.is_valid_address(
-        '0x5bD723CdfDa91B63aF3ff6BeC26443D5805a478B')
-    assert ethereum_utilities.is_valid_address(
-        '0x8C6C886E27477Fcb722c9b25225a99239309eF40')
-    # Invalid Ethereum checksum addresses
-    assert not ethereum_utilities.is_valid_address(
-        '0x2f64230f0affca54563958caf89c9710f132cfe3')
-    assert not ethereum_utilities.is_valid_address(
-        '0x5bd723cdfda91b63af3ff6bec26443d5805a478b')
-    assert not ethereum_utilities.is_valid_address(
-        '0x8c6c886e27477fcb722c9b25225a99239309ef40')
-    assert not ethereum_utilities.is_valid_address(None)
-    assert not ethereum_utilities.is_valid_address(0)
-    assert not ethereum_utilities.is_valid_address(1)
-    assert not ethereum_utilities.is_valid_address('')
-    assert not ethereum_utilities.is_valid_address(' ')
+@pytest.mark.parametrize(
+    ('address', 'is_valid'),
+    [
+        # Valid Ethereum checksum addresses
+        ('0x2F64230f0AFFCA54563958caF89c9710f132cFe3', True),
+        ('0x5bD723CdfDa91B63aF3ff6BeC26443D5805a478B', True),
+        ('0x8C6C886E27477Fcb722c9b25225a99239309eF40', True),
+        # Invalid Ethereum checksum addresses
+        ('0x2f64230f0affca54563958caf89c9710f132cfe3', False),
+        ('0x5bd723cdfda91b63af3ff6bec26443d5805a478b', False),
+        ('0x8c6c886e27477fcb722c9b25225a99239309ef40', False),
+        (None, False),
+        (0, False),
+        (1, False),
+        ('', False),
+        (' ', False)
+    ])
+def test_is_valid_address(address, is_valid, ethereum_utilities):
+    assert ethereum_utilities.is_valid_address(address) is is_valid
 
 
 def test_get_transaction_method_names_correct(ethereum_utilities):
@@ -388,12 +408,14 @@ def test_read_transaction_status_correct(mocked_retrieve_revert_message,
         'blockNumber': transaction_parameters[0],
         'status': transaction_parameters[1]
     }
-    with unittest.mock.patch.object(w3.eth, 'get_transaction_receipt',
-                                    return_value=mock_transaction_receipt):
-        with unittest.mock.patch.object(w3.eth, 'get_block_number',
-                                        return_value=1000):
-            transaction_status = ethereum_utilities.read_transaction_status(
-                transaction_id, node_connections)
+    with (
+            unittest.mock.patch.object(w3.eth, 'get_transaction_receipt',
+                                       return_value=mock_transaction_receipt),
+            unittest.mock.patch.object(w3.eth, 'get_block_number',
+                                       return_value=1000),
+    ):
+        transaction_status = ethereum_utilities.read_transaction_status(
+            transaction_id, node_connections)
     assert transaction_status is transaction_parameters[2]
 
 
@@ -433,19 +455,21 @@ def test_submit_transaction_correct(mock_create_contract,
                                     transaction_submission_request,
                                     transaction_id):
     mock_type_2_transactions_supported.return_value = type_2_transaction
-    with unittest.mock.patch(
-            'pantos.common.blockchains.ethereum.web3.Account.sign_transaction'
+    mock_send_raw_transaction = unittest.mock.MagicMock()
+    mock_send_raw_transaction.return_value.to_0x_hex.return_value = \
+        transaction_id
+    with (
+            unittest.mock.patch('pantos.common.blockchains.ethereum.web3.'
+                                'Account.sign_transaction'),
+            unittest.mock.patch.object(
+                w3.eth, 'get_block', return_value={'baseFeePerGas': int(1e8)}),
+            unittest.mock.patch.object(w3.eth, 'send_raw_transaction',
+                                       mock_send_raw_transaction),
     ):
-        with unittest.mock.patch.object(
-                w3.eth, 'get_block', return_value={'baseFeePerGas': int(1e8)}):
-            with unittest.mock.patch.object(
-                    w3.eth,
-                    'send_raw_transaction') as mock_send_raw_transaction:
-                mock_send_raw_transaction().to_0x_hex.return_value = \
-                    transaction_id
-                response = ethereum_utilities.submit_transaction(
-                    transaction_submission_request)
+        response = ethereum_utilities.submit_transaction(
+            transaction_submission_request)
     assert response.transaction_id == transaction_id
+    mock_send_raw_transaction.assert_called_once()
 
 
 def test_submit_transaction_default_private_key_error(
@@ -459,38 +483,40 @@ def test_submit_transaction_default_private_key_error(
 
 def test_submit_transaction_gas_error(ethereum_utilities,
                                       transaction_submission_request):
-    transaction_submission_request.gas = 1000
+    request = dataclasses.replace(transaction_submission_request, gas=1000)
     with pytest.raises(EthereumUtilitiesError):
-        ethereum_utilities.submit_transaction(transaction_submission_request)
+        ethereum_utilities.submit_transaction(request)
 
 
 def test_submit_transaction_min_adaptable_fee_per_gas_error(
         ethereum_utilities, transaction_submission_request):
-    transaction_submission_request.min_adaptable_fee_per_gas = -1
+    request = dataclasses.replace(transaction_submission_request,
+                                  min_adaptable_fee_per_gas=-1)
     with pytest.raises(EthereumUtilitiesError):
-        ethereum_utilities.submit_transaction(transaction_submission_request)
+        ethereum_utilities.submit_transaction(request)
 
 
 def test_submit_transaction_max_total_fee_per_gas_error(
         ethereum_utilities, transaction_submission_request):
-    transaction_submission_request.max_total_fee_per_gas = \
-        transaction_submission_request.min_adaptable_fee_per_gas - 1
+    request = dataclasses.replace(
+        transaction_submission_request, max_total_fee_per_gas=(
+            transaction_submission_request.min_adaptable_fee_per_gas - 1))
     with pytest.raises(EthereumUtilitiesError):
-        ethereum_utilities.submit_transaction(transaction_submission_request)
+        ethereum_utilities.submit_transaction(request)
 
 
 def test_submit_transaction_amount_error(ethereum_utilities,
                                          transaction_submission_request):
-    transaction_submission_request.amount = -1
+    request = dataclasses.replace(transaction_submission_request, amount=-1)
     with pytest.raises(EthereumUtilitiesError):
-        ethereum_utilities.submit_transaction(transaction_submission_request)
+        ethereum_utilities.submit_transaction(request)
 
 
 def test_submit_transaction_nonce_error(ethereum_utilities,
                                         transaction_submission_request):
-    transaction_submission_request.nonce = -1
+    request = dataclasses.replace(transaction_submission_request, nonce=-1)
     with pytest.raises(EthereumUtilitiesError):
-        ethereum_utilities.submit_transaction(transaction_submission_request)
+        ethereum_utilities.submit_transaction(request)
 
 
 @unittest.mock.patch.object(EthereumUtilities, 'create_contract')
@@ -498,18 +524,19 @@ def test_submit_transaction_max_fee_per_gas_error(
         mock_create_contract, ethereum_utilities, w3,
         transaction_submission_request, transaction_id):
     base_fee_per_gas = int(1e8)
-    transaction_submission_request.max_total_fee_per_gas = (
-        base_fee_per_gas +
-        transaction_submission_request.min_adaptable_fee_per_gas)
-    with unittest.mock.patch(
-            'pantos.common.blockchains.ethereum.web3.Account.sign_transaction'
-    ):
-        with unittest.mock.patch.object(
+    request = dataclasses.replace(
+        transaction_submission_request, max_total_fee_per_gas=(
+            base_fee_per_gas +
+            transaction_submission_request.min_adaptable_fee_per_gas))
+    with (
+            unittest.mock.patch('pantos.common.blockchains.ethereum.web3.'
+                                'Account.sign_transaction'),
+            unittest.mock.patch.object(
                 w3.eth, 'get_block',
-                return_value={'baseFeePerGas': base_fee_per_gas}):
-            with pytest.raises(EthereumUtilitiesError):
-                ethereum_utilities.submit_transaction(
-                    transaction_submission_request)
+                return_value={'baseFeePerGas': base_fee_per_gas}),
+    ):
+        with pytest.raises(EthereumUtilitiesError):
+            ethereum_utilities.submit_transaction(request)
 
 
 @unittest.mock.patch.object(EthereumUtilities,
@@ -520,76 +547,41 @@ def test_submit_transaction_gas_price__error(
         mock_create_contract, mock_type_2_transactions_supported,
         ethereum_utilities, w3, transaction_submission_request,
         transaction_id):
-    transaction_submission_request.min_adaptable_fee_per_gas = 1
-    transaction_submission_request.max_total_fee_per_gas = 1
+    request = dataclasses.replace(transaction_submission_request,
+                                  min_adaptable_fee_per_gas=1,
+                                  max_total_fee_per_gas=1)
     with unittest.mock.patch(
             'pantos.common.blockchains.ethereum.web3.Account.sign_transaction'
     ):
         with pytest.raises(EthereumUtilitiesError):
-            ethereum_utilities.submit_transaction(
-                transaction_submission_request)
-
-
+            ethereum_utilities.submit_transaction(request)
+
+
+@pytest.mark.parametrize(('send_error', 'expected_error'), [
+    (ValueError({
+        'code': '-32000',
+        'message': 'nonce too low'
+    }), TransactionNonceTooLowError),
+    (ValueError({
+        'code': '-32000',
+        'message': 'transaction underpriced'
+    }), TransactionUnderpricedError),
+    (ValueError('some error'), EthereumUtilitiesError),
+    (ResultsNotMatchingError, ResultsNotMatchingError),
+])
 @unittest.mock.patch.object(EthereumUtilities, 'create_contract')
-def test_submit_transaction_nonce_too_low_error(
-        mock_create_contract, ethereum_utilities, w3,
-        transaction_submission_request):
-    with unittest.mock.patch(
-            'pantos.common.blockchains.ethereum.web3.Account.sign_transaction'
+def test_submit_transaction_send_error(mock_create_contract, send_error,
+                                       expected_error, ethereum_utilities, w3,
+                                       transaction_submission_request):
+    with (
+            unittest.mock.patch('pantos.common.blockchains.ethereum.web3.'
+                                'Account.sign_transaction'),
+            unittest.mock.patch.object(w3.eth, 'send_raw_transaction',
+                                       side_effect=send_error),
     ):
-        with unittest.mock.patch.object(
-                w3.eth, 'send_raw_transaction', side_effect=ValueError({
-                    'code': '-32000',
-                    'message': 'nonce too low'
-                })):
-            with pytest.raises(TransactionNonceTooLowError):
-                ethereum_utilities.submit_transaction(
-                    transaction_submission_request)
-
-
-@unittest.mock.patch.object(EthereumUtilities, 'create_contract')
-def test_submit_transaction_underpriced_error(mock_create_contract,
-                                              ethereum_utilities, w3,
-                                              transaction_submission_request):
-    with unittest.mock.patch(
-            'pantos.common.blockchains.ethereum.web3.Account.sign_transaction'
-    ):
-        with unittest.mock.patch.object(
-                w3.eth, 'send_raw_transaction', side_effect=ValueError({
-                    'code': '-32000',
-                    'message': 'transaction underpriced'
-                })):
-            with pytest.raises(TransactionUnderpricedError):
-                ethereum_utilities.submit_transaction(
-                    transaction_submission_request)
-
-
-@unittest.mock.patch.object(EthereumUtilities, 'create_contract')
-def test_submit_transaction_other_send_error(mock_create_contract,
-                                             ethereum_utilities, w3,
-                                             transaction_submission_request):
-    with unittest.mock.patch(
-            'pantos.common.blockchains.ethereum.web3.Account.sign_transaction'
-    ):
-        with unittest.mock.patch.object(w3.eth, 'send_raw_transaction',
-                                        side_effect=ValueError('some error')):
-            with pytest.raises(EthereumUtilitiesError):
-                ethereum_utilities.submit_transaction(
-                    transaction_submission_request)
-
-
-@unittest.mock.patch.object(EthereumUtilities, 'create_contract')
-def test_submit_transaction_results_not_matching_error(
-        mock_create_contract, ethereum_utilities, w3,
-        transaction_submission_request):
-    with unittest.mock.patch(
-            'pantos.common.blockchains.ethereum.web3.Account.sign_transaction'
-    ):
-        with unittest.mock.patch.object(w3.eth, 'send_raw_transaction',
-                                        side_effect=ResultsNotMatchingError):
-            with pytest.raises(ResultsNotMatchingError):
-                ethereum_utilities.submit_transaction(
-                    transaction_submission_request)
+        with pytest.raises(expected_error):
+            ethereum_utilities.submit_transaction(
+                transaction_submission_request)
 
 
 @unittest.mock.patch('pantos.common.blockchains.ethereum.web3')
@@ -643,81 +635,29 @@ def test_create_single_node_connection_not_connected_error(
         ethereum_utilities._create_single_node_connection(blockchain_node_url)
 
 
-def test_retrieve_revert_message_correct(ethereum_utilities, w3,
+@pytest.mark.parametrize(('call_behavior', 'revert_message'), [
+    ({
+        'side_effect': web3.exceptions.ContractLogicError('revert message')
+    }, 'revert message'),
+    ({
+        'side_effect': ValueError(
+            {'message': f'{_NO_ARCHIVE_NODE_RPC_ERROR_MESSAGE} 0x...'})
+    }, f'unknown {_NO_ARCHIVE_NODE_LOG_MESSAGE}'),
+    ({
+        'return_value': ''
+    }, 'unknown'),
+    ({
+        'side_effect': Exception
+    }, 'unknown'),
+])
+def test_retrieve_revert_message_correct(call_behavior, revert_message,
+                                         ethereum_utilities, w3,
                                          node_connections, transaction_id,
-                                         contract_address):
-    default_account = w3.eth.accounts[0]
-    with unittest.mock.patch.object(
-            w3.eth, 'get_transaction', return_value={
-                'from': default_account,
-                'to': contract_address,
-                'value': 0,
-                'input': "",
-                'blockNumber': 1,
-            }):
-        with unittest.mock.patch.object(
-                w3.eth, 'call', side_effect=web3.exceptions.ContractLogicError(
-                    'revert message')):
-            assert \
-                ethereum_utilities._EthereumUtilities__retrieve_revert_message(
-                    transaction_id, node_connections) == 'revert message'
-
-
-def test_retrieve_revert_message_no_archive_node_available_error(
-        ethereum_utilities, w3, node_connections, transaction_id,
-        contract_address):
-    default_account = w3.eth.accounts[0]
-    with unittest.mock.patch.object(
-            w3.eth, 'get_transaction', return_value={
-                'from': default_account,
-                'to': contract_address,
-                'value': 0,
-                'input': "",
-                'blockNumber': 1,
-            }):
-        with unittest.mock.patch.object(
-                w3.eth, 'call', side_effect=ValueError({
-                    'message': f'{_NO_ARCHIVE_NODE_RPC_ERROR_MESSAGE} 0x...'
-                })):
-            assert \
-                ethereum_utilities._EthereumUtilities__retrieve_revert_message(
-                    transaction_id, node_connections) == \
-                f'unknown {_NO_ARCHIVE_NODE_LOG_MESSAGE}'
-
-
-def test_retrieve_revert_message_correct_no_error(ethereum_utilities, w3,
-                                                  node_connections,
-                                                  transaction_id,
-                                                  contract_address):
-    default_account = w3.eth.accounts[0]
-    with unittest.mock.patch.object(
-            w3.eth, 'get_transaction', return_value={
-                'from': default_account,
-                'to': contract_address,
-                'value': 0,
-                'input': "",
-                'blockNumber': 1,
-            }):
-        with unittest.mock.patch.object(w3.eth, 'call', return_value=''):
-            assert \
-                ethereum_utilities._EthereumUtilities__retrieve_revert_message(
-                    transaction_id, node_connections) == 'unknown'
-
-
-def test_retrieve_revert_message_correct_error(ethereum_utilities, w3,
-                                               node_connections,
-                                               transaction_id,
-                                               contract_address):
-    default_account = w3.eth.accounts[0]
-    with unittest.mock.patch.object(
-            w3.eth, 'get_transaction', return_value={
-                'from': default_account,
-                'to': contract_address,
-                'value': 0,
-                'input': "",
-                'blockNumber': 1,
-            }):
-        with unittest.mock.patch.object(w3.eth, 'call', side_effect=Exception):
-            assert \
-                ethereum_utilities._EthereumUtilities__retrieve_revert_message(
-                    transaction_id, node_connections) == 'unknown'
+                                         reverted_transaction):
+    with (
+            unittest.mock.patch.object(w3.eth, 'get_transaction',
+                                       return_value=reverted_transaction),
+            unittest.mock.patch.object(w3.eth, 'call', **call_behavior),
+    ):
+        assert ethereum_utilities._EthereumUtilities__retrieve_revert_message(
+            transaction_id, node_connections) == revert_message
@@ -17,14 +17,26 @@ from pantos.common.blockchains.solana import SolanaUtilities
 from pantos.common.blockchains.sonic import SonicUtilities
 from pantos.common.exceptions import NotInitializedError
 
+_ALL_BLOCKCHAINS = tuple(Blockchain)
+
+_BLOCKCHAIN_UTILITIES_CLASSES = {
+    Blockchain.AVALANCHE: AvalancheUtilities,
+    Blockchain.BNB_CHAIN: BnbChainUtilities,
+    Blockchain.CELO: CeloUtilities,
+    Blockchain.CRONOS: CronosUtilities,
+    Blockchain.ETHEREUM: EthereumUtilities,
+    Blockchain.SONIC: SonicUtilities,
+    Blockchain.POLYGON: PolygonUtilities,
+    Blockchain.SOLANA: SolanaUtilities
+}
+
 
 @pytest.fixture(autouse=True)
 def clear_blockchain_utilities():
     _blockchain_utilities.clear()
 
 
-@pytest.mark.parametrize('blockchain',
-                         [blockchain for blockchain in Blockchain])
+@pytest.mark.parametrize('blockchain', _ALL_BLOCKCHAINS)
 def test_get_blockchain_utilities_initialized(
         blockchain, blockchain_node_urls, fallback_blockchain_node_urls,
         average_block_time, required_transaction_confirmations,
@@ -42,28 +54,14 @@ def test_get_blockchain_utilities_initialized(
         assert isinstance(blockchain_utilities, blockchain_utilities_class)
 
 
-@pytest.mark.parametrize('blockchain',
-                         [blockchain for blockchain in Blockchain])
+@pytest.mark.parametrize('blockchain', _ALL_BLOCKCHAINS)
 def test_get_blockchain_utilities_not_initialized(blockchain):
     with pytest.raises(NotInitializedError):
         get_blockchain_utilities(blockchain)
 
 
 def _get_blockchain_utilities_class(blockchain):
-    if blockchain is Blockchain.AVALANCHE:
-        return AvalancheUtilities
-    if blockchain is Blockchain.BNB_CHAIN:
-        return BnbChainUtilities
-    if blockchain is Blockchain.CELO:
-        return CeloUtilities
-    if blockchain is Blockchain.CRONOS:
-        return CronosUtilities
-    if blockchain is Blockchain.ETHEREUM:
-        return EthereumUtilities
-    if blockchain is Blockchain.SONIC:
-        return SonicUtilities
-    if blockchain is Blockchain.POLYGON:
-        return PolygonUtilities
-    if blockchain is Blockchain.SOLANA:
-        return SolanaUtilities
-    raise NotImplementedError
+    try:
+        return _BLOCKCHAIN_UTILITIES_CLASSES[blockchain]
+    except KeyError:
+        raise NotImplementedError
@@ -1,11 +1,25 @@
+import os
 import pathlib
+import threading
 from unittest.mock import mock_open
 from unittest.mock import patch
 
+import dotenv
 import pytest
+import yaml
 
 from pantos.common.configuration import Config
 from pantos.common.configuration import ConfigError
+from pantos.common.configuration import _get_custom_validator_class
+from pantos.common.configuration import _get_validator
+from pantos.common.configuration import _remove_duplicate_paths
+
+
+@pytest.fixture(autouse=True)
+def validator_cache():
+    with patch('pantos.common.configuration._validator_cache',
+               threading.local()) as validator_cache:
+        yield validator_cache
 
 
 def test_validate_one_not_present():
@@ -86,14 +100,17 @@ def test_validate_load_os_error_escalates(mock_is_file):
         config._Config__validate(config_dict, validation_schema)
 
 
+@patch.dict('pantos.common.configuration._ENV_FILE_CACHE', clear=True)
+@patch('pathlib.Path.stat')
 @patch('pathlib.Path.is_file')
-@patch('dotenv.load_dotenv')
+@patch('dotenv.dotenv_values')
 @patch('pyaml_env.parse_config')
 @patch('builtins.open', new_callable=mock_open, read_data="data")
-def test_parse_file(mock_open, mock_parse_config, mock_load_dotenv,
-                    mock_is_file):
+def test_parse_file(mock_open, mock_parse_config, mock_dotenv_values,
+                    mock_is_file, mock_stat):
     mock_is_file.return_value = True
-    mock_load_dotenv.return_value = True
+    mock_stat.return_value.st_mtime_ns = 0
+    mock_dotenv_values.return_value = {}
     mock_parse_config.return_value = {'key': 'value'}
 
     config = Config('config.yaml')
@@ -102,18 +119,21 @@ def test_parse_file(mock_open, mock_parse_config, mock_load_dotenv,
 
     assert result == {'key': 'value'}
 
-    mock_load_dotenv.assert_called_once()
+    mock_dotenv_values.assert_called_once()
     mock_parse_config.assert_called_once()
 
 
+@patch.dict('pantos.common.configuration._ENV_FILE_CACHE', clear=True)
+@patch('pathlib.Path.stat')
 @patch('pathlib.Path.is_file')
-@patch('dotenv.load_dotenv')
+@patch('dotenv.dotenv_values')
 @patch('pyaml_env.parse_config')
 @patch('builtins.open', new_callable=mock_open, read_data="data")
-def test_parse_file_error(mock_open, mock_parse_config, mock_load_dotenv,
-                          mock_is_file):
+def test_parse_file_error(mock_open, mock_parse_config, mock_dotenv_values,
+                          mock_is_file, mock_stat):
     mock_is_file.return_value = True
-    mock_load_dotenv.side_effect = Exception()
+    mock_stat.return_value.st_mtime_ns = 0
+    mock_dotenv_values.side_effect = Exception()
     mock_parse_config.return_value = {'key': 'value'}
 
     config = Config('config.yaml')
@@ -121,3 +141,124 @@ def test_parse_file_error(mock_open, mock_parse_config, mock_load_dotenv,
         pathlib.Path('config.yaml'))  # Accessing private function
 
     assert result == {'key': 'value'}
+
+
+@patch.dict(os.environ, {'PANTOS_EXISTING_VALUE': 'existing'})
+@patch.dict('pantos.common.configuration._ENV_FILE_CACHE', clear=True)
+@patch('pyaml_env.parse_config')
+def test_parse_file_env_file_cached(mock_parse_config, tmp_path):
+    os.environ.pop('PANTOS_NEW_VALUE', None)
+    config_path = tmp_path / 'config.yaml'
+    config_path.with_suffix('.env').write_text(
+        'PANTOS_EXISTING_VALUE=other\nPANTOS_NEW_VALUE=new\n')
+    mock_parse_config.return_value = {'key': 'value'}
+    config = Config('config.yaml')
+
+    with patch('dotenv.dotenv_values',
+               wraps=dotenv.dotenv_values) as mock_dotenv_values:
+        config._Config__parse_file(config_path)
+        del os.environ['PANTOS_NEW_VALUE']
+        config._Config__parse_file(config_path)
+
+    mock_dotenv_values.assert_called_once()
+    assert os.environ['PANTOS_EXISTING_VALUE'] == 'existing'
+    assert os.environ['PANTOS_NEW_VALUE'] == 'new'
+
+
+def test_parse_file_does_not_modify_safe_loader(tmp_path, monkeypatch):
+    monkeypatch.setenv('PANTOS_TEST_VALUE', 'value')
+    config_path = tmp_path / 'config.yaml'
+    config_path.write_text('key: !ENV ${PANTOS_TEST_VALUE}\n')
+    implicit_resolvers = yaml.SafeLoader.yaml_implicit_resolvers.copy()
+
+    config = Config('config.yaml')
+    result = config._Config__parse_file(config_path)
+
+    assert result == {'key': 'value'}
+    assert '!ENV' not in yaml.SafeLoader.yaml_constructors
+    assert '!ENV' not in yaml.CSafeLoader.yaml_constructors
+    assert yaml.SafeLoader.yaml_implicit_resolvers == implicit_resolvers
+
+
+def test_remove_duplicate_paths(tmp_path):
+    directory = tmp_path / 'directory'
+    directory.mkdir()
+    link = tmp_path / 'link'
+    link.symlink_to(directory)
+    paths = [directory, tmp_path, link, directory / '..' / 'directory']
+
+    unique_paths = _remove_duplicate_paths(paths)
+
+    assert unique_paths == [directory, tmp_path]
+
+
+def test_remove_duplicate_paths_symlink_kept(tmp_path):
+    directory = tmp_path / 'directory'
+    directory.mkdir()
+    link = tmp_path / 'link'
+    link.symlink_to(directory)
+
+    unique_paths = _remove_duplicate_paths([link, tmp_path])
+
+    assert unique_paths == [link, tmp_path]
+
+
+def test_validate_validator_cached():
+    validation_schema = {'key': {'type': 'string', 'default': 'default'}}
+    config = Config('')
+
+    with patch('pantos.common.configuration._get_custom_validator_class',
+               wraps=_get_custom_validator_class) as mock_get_class:
+        first_result = config._Config__validate({'key': 'value'},
+                                                validation_schema)
+        second_result = config._Config__validate({}, validation_schema)
+
+    assert first_result == {'key': 'value'}
+    assert second_result == {'key': 'default'}
+    mock_get_class.assert_called_once()
+
+
+def test_validate_validator_schema_changed():
+    validation_schema = {'key': {'type': 'string', 'default': 'default'}}
+    config = Config('')
+
+    first_result = config._Config__validate({}, validation_schema)
+    validation_schema['key']['default'] = 'changed'
+    second_result = config._Config__validate({}, validation_schema)
+
+    assert first_result == {'key': 'default'}
+    assert second_result == {'key': 'changed'}
+
+
+@patch('pantos.common.configuration._VALIDATOR_CACHE_SIZE', 1)
+def test_validate_validator_cache_bounded(validator_cache):
+    second_validation_schema = {'second_key': {'type': 'string'}}
+    config = Config('')
+
+    config._Config__validate({}, {'first_key': {'type': 'string'}})
+    config._Config__validate({}, second_validation_schema)
+
+    assert list(validator_cache.validators) == [repr(second_validation_schema)]
+
+
+def test_get_validator_not_shared_between_threads():
+    validation_schema = {'key': {'type': 'string'}}
+    validators = []
+
+    def get_validator():
+        validators.append(_get_validator(validation_schema))
+
+    get_validator()
+    thread = threading.Thread(target=get_validator)
+    thread.start()
+    thread.join()
+
+    assert validators[0] is _get_validator(validation_schema)
+    assert validators[1] is not validators[0]
+
+
+def test_validate_schema_invalid():
+    config = Config('')
+
+    with pytest.raises(ConfigError):
+        config._Config__validate({}, {'key': {'type': 'unknown'}})
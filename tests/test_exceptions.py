@@ -2,6 +2,7 @@ import itertools
 
 import pytest
 
+from pantos.common.blockchains.enums import Blockchain
 from pantos.common.exceptions import BaseError
 from pantos.common.exceptions import ErrorCreator
 
@@ -70,3 +71,40 @@ def test_error_creator_create_error_correct(specialized_error_class,
     assert all(
         str(part) in str(error)
         for part in itertools.chain.from_iterable(kwargs.items()))
+
+
+@pytest.mark.parametrize(
+    'specialized_error_class',
+    [None, _SpecializedErrorWithMessage, _SpecializedErrorWithoutMessage])
+def test_error_creator_create_error_class_reused(specialized_error_class):
+    message = (None if specialized_error_class is _SpecializedErrorWithMessage
+               else 'error message')
+    first_error = _Subclass()._create_error(
+        message, specialized_error_class=specialized_error_class)
+    second_error = _Subclass()._create_error(
+        message, specialized_error_class=specialized_error_class)
+    expected_class_name = (_SubclassError.__name__ if specialized_error_class
+                           is None else specialized_error_class.__name__)
+    assert type(first_error) is type(second_error)
+    assert type(first_error).__name__ == expected_class_name
+
+
+def test_base_error_str_correct():
+    error = BaseError('error message', blockchain=Blockchain.ETHEREUM,
+                      amount=100)
+
+    assert str(error) == 'error message - blockchain: ETHEREUM - amount: 100'
+
+
+def test_base_error_str_details_changed_correct():
+    error = BaseError('error message', amount=100)
+    str(error)
+
+    error.details['amount'] = 200
+    error.details['blockchain'] = Blockchain.ETHEREUM
+
+    assert str(error) == 'error message - amount: 200 - blockchain: ETHEREUM'
+
+    error.details = {'fee': 10}
+
+    assert str(error) == 'error message - fee: 10'
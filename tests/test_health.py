@@ -1,12 +1,18 @@
+import concurrent.futures
+import threading
 import unittest.mock
 
 import pytest
 
+import pantos.common.health
 from pantos.common.blockchains.base import GENERAL_RPC_ERROR_MESSAGE
 from pantos.common.blockchains.enums import Blockchain
 from pantos.common.exceptions import NotInitializedError
 from pantos.common.health import NodesHealth
 from pantos.common.health import check_blockchain_nodes_health
+from pantos.common.health import get_cached_blockchain_nodes_health
+from pantos.common.health import start_nodes_health_refresher
+from pantos.common.health import stop_nodes_health_refresher
 
 NODE_RPC_DOMAIN_1 = 'domain.example.com'
 NODE_RPC_DOMAIN_2 = 'domain.example2.com'
@@ -15,6 +21,7 @@ NODE_RPC_DOMAIN_2 = 'domain.example2.com'
 @unittest.mock.patch(
     'pantos.common.health._blockchain_nodes',
     {Blockchain.ETHEREUM: ([NODE_RPC_DOMAIN_1, NODE_RPC_DOMAIN_2], 10)})
+@unittest.mock.patch('pantos.common.health._blockchain_utilities', {})
 @unittest.mock.patch('pantos.common.health.get_blockchain_utilities')
 def test_check_blockchain_nodes_health_correct(
         mocked_get_blockchain_utilities):
@@ -38,3 +45,181 @@ def test_check_blockchain_nodes_health_correct(
 def test_check_blockchain_nodes_health_uninitialized_nodes():
     with pytest.raises(NotInitializedError):
         check_blockchain_nodes_health()
+
+
+@unittest.mock.patch(
+    'pantos.common.health._blockchain_nodes',
+    {blockchain: ([NODE_RPC_DOMAIN_1], 10)
+     for blockchain in Blockchain})
+@unittest.mock.patch('pantos.common.health._blockchain_utilities', {})
+@unittest.mock.patch('pantos.common.health.get_blockchain_utilities')
+def test_check_blockchain_nodes_health_concurrent_callers_correct(
+        mocked_get_blockchain_utilities):
+    # All blockchain nodes of both health checks must be checked at the
+    # same time to pass the barrier
+    barrier = threading.Barrier(2 * len(Blockchain), timeout=10)
+
+    def get_unhealthy_nodes(nodes, timeout):
+        barrier.wait()
+        return []
+
+    mocked_get_blockchain_utilities().get_unhealthy_nodes.side_effect = \
+        get_unhealthy_nodes
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [
+            executor.submit(check_blockchain_nodes_health) for _ in range(2)
+        ]
+        results = [future.result() for future in futures]
+
+    assert results[0] == results[1] == {
+        blockchain: NodesHealth(1, 0, [])
+        for blockchain in Blockchain
+    }
+
+
+@unittest.mock.patch('pantos.common.health._blockchain_nodes',
+                     {Blockchain.ETHEREUM: ([NODE_RPC_DOMAIN_1], 10)})
+@unittest.mock.patch('pantos.common.health._blockchain_utilities', {})
+@unittest.mock.patch('pantos.common.health.get_blockchain_utilities')
+def test_check_blockchain_nodes_health_utilities_reused(
+        mocked_get_blockchain_utilities):
+    mocked_get_blockchain_utilities().get_unhealthy_nodes.return_value = []
+    mocked_get_blockchain_utilities.reset_mock()
+
+    check_blockchain_nodes_health()
+    check_blockchain_nodes_health()
+
+    mocked_get_blockchain_utilities.assert_called_once_with(
+        Blockchain.ETHEREUM)
+
+
+@unittest.mock.patch('pantos.common.health._nodes_health_refresher', None)
+@unittest.mock.patch('pantos.common.health.check_blockchain_nodes_health')
+def test_get_cached_blockchain_nodes_health_no_refresher_correct(
+        mocked_check_blockchain_nodes_health):
+    nodes_health = {Blockchain.ETHEREUM: NodesHealth(1, 0, [])}
+    mocked_check_blockchain_nodes_health.return_value = nodes_health
+
+    first_result = get_cached_blockchain_nodes_health()
+    second_result = get_cached_blockchain_nodes_health()
+
+    assert first_result is nodes_health
+    assert second_result is nodes_health
+    assert mocked_check_blockchain_nodes_health.call_count == 2
+
+
+@unittest.mock.patch('pantos.common.health._nodes_health_refresher',
+                     unittest.mock.Mock())
+@unittest.mock.patch('pantos.common.health._nodes_health_snapshot', None)
+@unittest.mock.patch('pantos.common.health._blockchain_nodes_generation', 0)
+@unittest.mock.patch('pantos.common.health.check_blockchain_nodes_health')
+def test_get_cached_blockchain_nodes_health_correct(
+        mocked_check_blockchain_nodes_health):
+    nodes_health = {Blockchain.ETHEREUM: NodesHealth(1, 0, [])}
+    mocked_check_blockchain_nodes_health.return_value = nodes_health
+
+    first_result = get_cached_blockchain_nodes_health()
+    second_result = get_cached_blockchain_nodes_health()
+
+    assert first_result is nodes_health
+    assert second_result is nodes_health
+    mocked_check_blockchain_nodes_health.assert_called_once_with()
+    assert pantos.common.health._nodes_health_snapshot == (0, nodes_health)
+
+
+@unittest.mock.patch('pantos.common.health._nodes_health_refresher',
+                     unittest.mock.Mock())
+@unittest.mock.patch('pantos.common.health._nodes_health_snapshot', (0, {
+    Blockchain.ETHEREUM: NodesHealth(1, 0, [])
+}))
+@unittest.mock.patch('pantos.common.health._blockchain_nodes_generation', 1)
+@unittest.mock.patch('pantos.common.health.check_blockchain_nodes_health')
+def test_get_cached_blockchain_nodes_health_previous_generation_correct(
+        mocked_check_blockchain_nodes_health):
+    nodes_health = {Blockchain.ETHEREUM: NodesHealth(0, 1, [])}
+    mocked_check_blockchain_nodes_health.return_value = nodes_health
+
+    result = get_cached_blockchain_nodes_health()
+
+    assert result is nodes_health
+    assert pantos.common.health._nodes_health_snapshot == (1, nodes_health)
+
+
+@unittest.mock.patch('pantos.common.health._nodes_health_refresher',
+                     unittest.mock.Mock())
+@unittest.mock.patch('pantos.common.health._blockchain_nodes', {})
+def test_get_cached_blockchain_nodes_health_uninitialized_nodes():
+    with pytest.raises(NotInitializedError):
+        get_cached_blockchain_nodes_health()
+
+
+@unittest.mock.patch('pantos.common.health._nodes_health_snapshot', None)
+@unittest.mock.patch('pantos.common.health._blockchain_nodes_generation', 0)
+@unittest.mock.patch('pantos.common.health.check_blockchain_nodes_health')
+def test_refresh_nodes_health_reinitialized_nodes_not_cached(
+        mocked_check_blockchain_nodes_health):
+    nodes_health = {Blockchain.ETHEREUM: NodesHealth(1, 0, [])}
+
+    def check_blockchain_nodes_health():
+        # The blockchain nodes are initialized again during the check
+        pantos.common.health._blockchain_nodes_generation = 1
+        return nodes_health
+
+    mocked_check_blockchain_nodes_health.side_effect = \
+        check_blockchain_nodes_health
+
+    result = pantos.common.health._refresh_nodes_health()
+
+    assert result is nodes_health
+    assert pantos.common.health._nodes_health_snapshot is None
+
+
+@unittest.mock.patch('pantos.common.health._nodes_health_refresher', None)
+@unittest.mock.patch('pantos.common.health._nodes_health_refresher_stopped',
+                     None)
+@unittest.mock.patch('pantos.common.health.threading.Thread')
+def test_start_nodes_health_refresher_correct(mocked_thread):
+    start_nodes_health_refresher(10.0)
+    start_nodes_health_refresher(10.0)
+
+    mocked_thread.assert_called_once()
+    assert mocked_thread.call_args.kwargs['args'] == (
+        10.0, pantos.common.health._nodes_health_refresher_stopped)
+    mocked_thread().start.assert_called_once_with()
+
+
+@unittest.mock.patch('pantos.common.health._nodes_health_refresher', None)
+@unittest.mock.patch('pantos.common.health._nodes_health_refresher_stopped',
+                     None)
+@unittest.mock.patch('pantos.common.health._nodes_health_snapshot', None)
+@unittest.mock.patch('pantos.common.health.check_blockchain_nodes_health')
+def test_stop_nodes_health_refresher_correct(
+        mocked_check_blockchain_nodes_health):
+    start_nodes_health_refresher(3600.0)
+    nodes_health_refresher = pantos.common.health._nodes_health_refresher
+
+    stop_nodes_health_refresher()
+
+    assert not nodes_health_refresher.is_alive()
+    assert pantos.common.health._nodes_health_refresher is None
+    mocked_check_blockchain_nodes_health.assert_not_called()
+
+
+@unittest.mock.patch('pantos.common.health._nodes_health_snapshot', None)
+@unittest.mock.patch('pantos.common.health._blockchain_nodes_generation', 0)
+@unittest.mock.patch('pantos.common.health.check_blockchain_nodes_health')
+def test_refresh_nodes_health_periodically_correct(
+        mocked_check_blockchain_nodes_health):
+    nodes_health = {Blockchain.ETHEREUM: NodesHealth(1, 0, [])}
+    mocked_check_blockchain_nodes_health.side_effect = [
+        Exception, nodes_health
+    ]
+    stopped = unittest.mock.Mock()
+    stopped.wait.side_effect = [False, False, True]
+
+    pantos.common.health._refresh_nodes_health_periodically(10.0, stopped)
+
+    stopped.wait.assert_called_with(10.0)
+    assert mocked_check_blockchain_nodes_health.call_count == 2
+    assert pantos.common.health._nodes_health_snapshot == (0, nodes_health)
@@ -1,3 +1,4 @@
+import datetime
 import enum
 import json
 import logging
@@ -83,6 +84,8 @@ def test_datadog_custom_formatter_format_correct(root_logger,
     assert json_formatted_log[_LOG_EXTRA_KEY_2] == _LOG_EXTRA_VALUE_2
     assert json_formatted_log[
         _LOG_EXTRA_KEY_3] == _LOG_EXTRA_VALUE_3.name.capitalize()
+    assert datetime.datetime.fromisoformat(
+        json_formatted_log['time']).tzinfo is datetime.UTC
 
 
 def test_datadog_custom_formatter_format_error_correct(
@@ -134,6 +137,7 @@ def test_initialize_logger_correct(logger, log_format, standard_output,
     rotating_file_handler = False
     for handler in logger.handlers:
         _check_log_format(log_format, handler)
+        assert handler.level == (logging.DEBUG if debug else logging.INFO)
         assert isinstance(handler, logging.StreamHandler)
         if isinstance(handler, logging.handlers.RotatingFileHandler):
             assert not rotating_file_handler
@@ -173,6 +177,21 @@ def test_initialize_logger_log_correct(root_logger, log_format):
     file_path.unlink()
 
 
+@pytest.mark.parametrize('log_format',
+                         [log_format for log_format in LogFormat])
+def test_initialize_logger_descendant_debug_not_logged(root_logger,
+                                                       log_format):
+    file_path = pathlib.Path(tempfile.mkstemp()[1])
+    log_file = LogFile(file_path, 0, 0)
+    initialize_logger(root_logger, log_format, False, log_file, False)
+    descendant_logger = root_logger.getChild('descendant')
+    descendant_logger.setLevel(logging.DEBUG)
+    descendant_logger.debug(_LOG_MESSAGE)
+    descendant_logger.setLevel(logging.NOTSET)
+    assert file_path.read_text() == ''
+    file_path.unlink()
+
+
 @unittest.mock.patch('pantos.common.logging.pathlib.Path.mkdir')
 def test_initialize_logger_permission_error(mocked_mkdir, root_logger):
     mocked_mkdir.side_effect = PermissionError
@@ -3,6 +3,7 @@ import unittest.mock
 import pytest
 import semantic_version  # type: ignore
 
+from pantos.common.protocol import _SUPPORTED_PROTOCOL_VERSIONS
 from pantos.common.protocol import get_latest_protocol_version
 from pantos.common.protocol import get_supported_protocol_versions
 from pantos.common.protocol import is_supported_protocol_version
@@ -39,8 +40,8 @@ _LATEST_PROTOCOL_VERSION_LARGE = _to_semantic_version('2.0.10')
 def test_get_latest_protocol_version_correct(supported_protocol_versions,
                                              latest_protocol_version):
     with unittest.mock.patch(
-            'pantos.common.protocol._SUPPORTED_PROTOCOL_VERSIONS',
-            supported_protocol_versions):
+            'pantos.common.protocol._SORTED_SUPPORTED_PROTOCOL_VERSIONS',
+            sorted(supported_protocol_versions)):
         assert get_latest_protocol_version() == latest_protocol_version
 
 
@@ -50,12 +51,20 @@ def test_get_latest_protocol_version_correct(supported_protocol_versions,
 ])
 def test_get_supported_protocol_versions_correct(supported_protocol_versions):
     with unittest.mock.patch(
-            'pantos.common.protocol._SUPPORTED_PROTOCOL_VERSIONS',
-            supported_protocol_versions):
+            'pantos.common.protocol._SORTED_SUPPORTED_PROTOCOL_VERSIONS',
+            sorted(supported_protocol_versions)):
         assert get_supported_protocol_versions() == sorted(
             supported_protocol_versions)
 
 
+def test_get_supported_protocol_versions_sorted_copy():
+    supported_protocol_versions = get_supported_protocol_versions()
+    supported_protocol_versions.clear()
+
+    assert get_supported_protocol_versions() == sorted(
+        _SUPPORTED_PROTOCOL_VERSIONS)
+
+
 @pytest.mark.parametrize(
     'supported_protocol_versions, protocol_version, is_supported',
     [(_SUPPORTED_PROTOCOL_VERSIONS_SMALL, '1.0.0', True),
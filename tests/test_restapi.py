@@ -1,9 +1,11 @@
 import json
 import unittest.mock
 
+import flask
 import pytest
 import werkzeug.exceptions
 
+import pantos.common.restapi
 from pantos.common.blockchains.base import GENERAL_RPC_ERROR_MESSAGE
 from pantos.common.blockchains.base import UnhealthyNode
 from pantos.common.blockchains.enums import Blockchain
@@ -41,9 +43,21 @@ def error_message_dict():
     }
 
 
+@pytest.fixture
+def request_context():
+    with flask.Flask(__name__).test_request_context():
+        yield
+
+
+@pytest.mark.parametrize('orjson_installed', [True, False])
 @unittest.mock.patch('pantos.common.restapi.check_blockchain_nodes_health')
-def test_nodes_health_resource_correct(mocked_check_blockchain_nodes_health):
-    mocked_check_blockchain_nodes_health.return_value = {
+@unittest.mock.patch(
+    'pantos.common.restapi.get_cached_blockchain_nodes_health')
+def test_nodes_health_resource_correct(
+        mocked_get_cached_blockchain_nodes_health,
+        mocked_check_blockchain_nodes_health, orjson_installed,
+        request_context):
+    mocked_get_cached_blockchain_nodes_health.return_value = {
         Blockchain.ETHEREUM: NodesHealth(1, 0, []),
         Blockchain.BNB_CHAIN: NodesHealth(0, 2, [
             UnhealthyNode('node1_domain', GENERAL_RPC_ERROR_MESSAGE),
@@ -52,7 +66,9 @@ def test_nodes_health_resource_correct(mocked_check_blockchain_nodes_health):
     }
     nodes_health_resource = NodesHealthResource()
 
-    response = nodes_health_resource.get()
+    orjson = pantos.common.restapi.orjson if orjson_installed else None
+    with unittest.mock.patch('pantos.common.restapi.orjson', orjson):
+        response = nodes_health_resource.get()
 
     assert response.status_code == 200
     assert json.loads(response.data) == {
@@ -73,26 +89,56 @@ def test_nodes_health_resource_correct(mocked_check_blockchain_nodes_health):
             }]
         }
     }
+    mocked_check_blockchain_nodes_health.assert_not_called()
 
 
+@unittest.mock.patch(
+    'pantos.common.restapi.get_cached_blockchain_nodes_health')
 @unittest.mock.patch('pantos.common.restapi.check_blockchain_nodes_health')
+def test_nodes_health_resource_fresh_correct(
+        mocked_check_blockchain_nodes_health,
+        mocked_get_cached_blockchain_nodes_health):
+    mocked_check_blockchain_nodes_health.return_value = {
+        Blockchain.ETHEREUM: NodesHealth(1, 0, [])
+    }
+    nodes_health_resource = NodesHealthResource()
+
+    with flask.Flask(__name__).test_request_context('/?fresh=1'):
+        response = nodes_health_resource.get()
+
+    assert response.status_code == 200
+    assert json.loads(response.data) == {
+        'Ethereum': {
+            'healthy_total': 1,
+            'unhealthy_total': 0,
+            'unhealthy_nodes': []
+        }
+    }
+    mocked_get_cached_blockchain_nodes_health.assert_not_called()
+
+
+@unittest.mock.patch(
+    'pantos.common.restapi.get_cached_blockchain_nodes_health')
 def test_nodes_health_resource_uninitialized_nodes(
-        mocked_check_blockchain_nodes_health):
-    mocked_check_blockchain_nodes_health.side_effect = NotInitializedError('')
+        mocked_get_cached_blockchain_nodes_health, request_context):
+    mocked_get_cached_blockchain_nodes_health.side_effect = \
+        NotInitializedError('')
     nodes_health_resource = NodesHealthResource()
 
-    with pytest.raises(werkzeug.exceptions.HTTPException) as exception_info:
-        nodes_health_resource.get()
+    response = nodes_health_resource.get()
 
-    assert isinstance(exception_info.value,
-                      werkzeug.exceptions.InternalServerError)
-    assert exception_info.value.data[
-        'message'] == 'no blockchain nodes have been initialized yet'
+    assert response.status_code == 500
+    assert response.mimetype == 'application/json'
+    assert json.loads(response.data) == {
+        'message': 'no blockchain nodes have been initialized yet'
+    }
 
 
-@unittest.mock.patch('pantos.common.restapi.check_blockchain_nodes_health')
-def test_nodes_health_resource_exception(mocked_check_blockchain_nodes_health):
-    mocked_check_blockchain_nodes_health.side_effect = Exception
+@unittest.mock.patch(
+    'pantos.common.restapi.get_cached_blockchain_nodes_health')
+def test_nodes_health_resource_exception(
+        mocked_get_cached_blockchain_nodes_health, request_context):
+    mocked_get_cached_blockchain_nodes_health.side_effect = Exception
     nodes_health_resource = NodesHealthResource()
 
     with pytest.raises(werkzeug.exceptions.HTTPException) as exception_info:
@@ -118,6 +164,59 @@ def test_ok_response():
     assert json.loads(response.data) == data
 
 
+@pytest.mark.parametrize('data', [{
+    'second_property': 'ä€𝄞',
+    'first_property': [1, 1.5, None, True],
+    'third_property': {
+        'b': {},
+        'a': []
+    }
+}, [{
+    'healthy_total': 1,
+    'unhealthy_nodes': ['\u00fc"\\\n']
+}]])
+def test_ok_response_orjson_output_identical(data):
+    if pantos.common.restapi.orjson is None:  # pragma: no cover
+        pytest.skip('orjson is not installed')
+
+    orjson_response = ok_response(data)
+    with unittest.mock.patch('pantos.common.restapi.orjson', None):
+        app = flask.Flask(__name__)
+        fallback_response = ok_response(data)
+        with app.app_context():
+            app_fallback_response = ok_response(data)
+
+    assert orjson_response.data == fallback_response.data
+    assert orjson_response.data == app_fallback_response.data
+    assert json.loads(orjson_response.data) == data
+
+
+def test_ok_response_large_integer():
+    data = {'amount': 2**256 - 1}
+
+    response = ok_response(data)
+
+    assert response.status_code == 200
+    assert json.loads(response.data) == data
+
+
+@unittest.mock.patch('pantos.common.restapi.orjson', None)
+def test_ok_response_application_json_provider():
+    app = flask.Flask(__name__)
+    app.json = unittest.mock.Mock(wraps=app.json)
+    data = {'first_property': 1, 'second_propery': 'a'}
+
+    with app.app_context():
+        response = ok_response(data)
+
+    app.json.dumps.assert_called_once_with(data, ensure_ascii=False,
+                                           separators=(',', ':'),
+                                           sort_keys=True)
+    assert response.status_code == 200
+    assert response.mimetype == 'application/json'
+    assert json.loads(response.data) == data
+
+
 def test_no_content_response():
     response = no_content_response()
 
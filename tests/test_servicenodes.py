@@ -1,3 +1,6 @@
+import dataclasses
+import gc
+import threading
 import unittest.mock
 import uuid
 
@@ -8,6 +11,8 @@ from pantos.common.blockchains.enums import Blockchain
 from pantos.common.entities import ServiceNodeBid
 from pantos.common.servicenodes import ServiceNodeClient
 from pantos.common.servicenodes import ServiceNodeClientError
+from pantos.common.servicenodes import _normalize_service_node_url
+from pantos.common.servicenodes import orjson as servicenodes_orjson
 from pantos.common.types import BlockchainAddress
 
 mock_transfer_request = ServiceNodeClient.SubmitTransferRequest(
@@ -49,9 +54,24 @@ mock_response_header_html = requests.utils.CaseInsensitiveDict(
     {'Content-Type': 'text/html; charset=UTF-8'})
 
 
+@pytest.fixture(autouse=True)
+def request_json_argument():
+    # The request bodies below are serialized by requests
+    with unittest.mock.patch('pantos.common.servicenodes.orjson', None):
+        yield
+
+
+def _create_response(content: bytes) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response.headers = mock_response_header
+    response._content = content
+    return response
+
+
 @unittest.mock.patch.object(ServiceNodeClient,
                             '_ServiceNodeClient__build_transfer_url')
-@unittest.mock.patch('pantos.common.servicenodes.requests.post')
+@unittest.mock.patch('pantos.common.servicenodes.requests.Session.post')
 def test_submit_transfer_correct(mocked_post, mocked_build_transfer_url):
     uuid_string = '123e4567-e89b-12d3-a456-426655440000'
     mocked_post().json.return_value = {'task_id': uuid_string}
@@ -69,11 +89,43 @@ def test_submit_transfer_correct(mocked_post, mocked_build_transfer_url):
     mocked_post().json.assert_called_with()
 
 
+@unittest.mock.patch('pantos.common.servicenodes.orjson', servicenodes_orjson)
+@unittest.mock.patch('pantos.common.servicenodes.requests.Session.post')
+def test_submit_transfer_pre_serialized_correct(mocked_post):
+    if servicenodes_orjson is None:  # pragma: no cover
+        pytest.skip('orjson is not installed')
+    mocked_post.return_value = _create_response(
+        b'{"task_id": "123e4567-e89b-12d3-a456-426655440000"}')
+
+    ServiceNodeClient().submit_transfer(mock_transfer_request)
+
+    post_arguments = mocked_post.call_args.kwargs
+    assert 'json' not in post_arguments
+    assert servicenodes_orjson.loads(
+        post_arguments['data']) == mock_service_node_request
+    assert post_arguments['headers'] == {'Content-Type': 'application/json'}
+
+
+@unittest.mock.patch('pantos.common.servicenodes.orjson', servicenodes_orjson)
+@unittest.mock.patch('pantos.common.servicenodes.requests.Session.post')
+def test_submit_transfer_large_amount_correct(mocked_post):
+    mocked_post.return_value = _create_response(
+        b'{"task_id": "123e4567-e89b-12d3-a456-426655440000"}')
+    transfer_request = dataclasses.replace(mock_transfer_request,
+                                           token_amount=2**256 - 1)
+
+    ServiceNodeClient().submit_transfer(transfer_request)
+
+    assert mocked_post.call_args.kwargs['json'] == {
+        **mock_service_node_request, 'amount': 2**256 - 1
+    }
+
+
 @unittest.mock.patch.object(ServiceNodeClient,
                             '_ServiceNodeClient__build_transfer_url')
 @unittest.mock.patch('pantos.common.servicenodes.locals',
                      return_value=['response'])
-@unittest.mock.patch('pantos.common.servicenodes.requests.post')
+@unittest.mock.patch('pantos.common.servicenodes.requests.Session.post')
 def test_submit_transfer_exception(mocked_post, mocked_locals,
                                    mocked_build_transfer_url):
     mocked_post(
@@ -89,7 +141,7 @@ def test_submit_transfer_exception(mocked_post, mocked_locals,
                             '_ServiceNodeClient__build_transfer_url')
 @unittest.mock.patch('pantos.common.servicenodes.locals',
                      return_value=['response'])
-@unittest.mock.patch('pantos.common.servicenodes.requests.post')
+@unittest.mock.patch('pantos.common.servicenodes.requests.Session.post')
 def test_submit_transfer_no_response_message_exception(
         mocked_post, mocked_locals, mocked_build_transfer_url):
     mocked_post(
@@ -105,7 +157,7 @@ def test_submit_transfer_no_response_message_exception(
                             '_ServiceNodeClient__build_transfer_url')
 @unittest.mock.patch('pantos.common.servicenodes.locals',
                      return_value=['response'])
-@unittest.mock.patch('pantos.common.servicenodes.requests.post')
+@unittest.mock.patch('pantos.common.servicenodes.requests.Session.post')
 def test_submit_transfer_html_response_exception(mocked_post, mocked_locals,
                                                  mocked_build_transfer_url):
     mocked_post(
@@ -118,6 +170,17 @@ def test_submit_transfer_html_response_exception(mocked_post, mocked_locals,
     assert not mocked_post.json.called
 
 
+@pytest.mark.parametrize(
+    'error',
+    [requests.exceptions.ConnectionError, requests.exceptions.Timeout])
+@unittest.mock.patch('pantos.common.servicenodes.requests.Session.post')
+def test_submit_transfer_connection_error(mocked_post, error):
+    mocked_post.side_effect = error
+
+    with pytest.raises(ServiceNodeClientError):
+        ServiceNodeClient().submit_transfer(mock_transfer_request)
+
+
 def test_build_transfer_url_no_slash_correct():
     url = 'some_url'
     result = ServiceNodeClient()._ServiceNodeClient__build_transfer_url(url)
@@ -130,7 +193,20 @@ def test_build_transfer_url_with_slash_correct():
     assert result == 'some_url/transfer'
 
 
-@unittest.mock.patch('pantos.common.servicenodes.requests.get')
+def test_normalize_service_node_url_cached_correct():
+    _normalize_service_node_url.cache_clear()
+
+    assert _normalize_service_node_url('some_url') == 'some_url/'
+    assert _normalize_service_node_url('some_url') == 'some_url/'
+    assert _normalize_service_node_url('some_url/') == 'some_url/'
+    assert _normalize_service_node_url('some_url//') == 'some_url/'
+
+    cache_info = _normalize_service_node_url.cache_info()
+    assert cache_info.hits == 1
+    assert cache_info.misses == 3
+
+
+@unittest.mock.patch('pantos.common.servicenodes.requests.Session.get')
 def test_bids_correct(mocked_get):
     url = 'mock_url'
     source_blockchain = Blockchain.ETHEREUM
@@ -147,7 +223,7 @@ def test_bids_correct(mocked_get):
                                      mock_bid_response['signature'])
 
 
-@unittest.mock.patch('pantos.common.servicenodes.requests.get')
+@unittest.mock.patch('pantos.common.servicenodes.requests.Session.get')
 def test_bids_url_has_slash_correc(mocked_get):
     url = 'mock_url/'
     source_blockchain = Blockchain.ETHEREUM
@@ -164,7 +240,7 @@ def test_bids_url_has_slash_correc(mocked_get):
                                      mock_bid_response['signature'])
 
 
-@unittest.mock.patch('pantos.common.servicenodes.requests.get')
+@unittest.mock.patch('pantos.common.servicenodes.requests.Session.get')
 def test_bids_service_node_client_error(mocked_get):
     url = 'mock_url'
     source_blockchain = Blockchain.ETHEREUM
@@ -179,7 +255,7 @@ def test_bids_service_node_client_error(mocked_get):
                                  destination_blockchain)
 
 
-@unittest.mock.patch('pantos.common.servicenodes.requests.get')
+@unittest.mock.patch('pantos.common.servicenodes.requests.Session.get')
 def test_bids_service_node_no_response_message_client_error(mocked_get):
     url = 'mock_url'
     source_blockchain = Blockchain.ETHEREUM
@@ -194,7 +270,7 @@ def test_bids_service_node_no_response_message_client_error(mocked_get):
                                  destination_blockchain)
 
 
-@unittest.mock.patch('pantos.common.servicenodes.requests.get')
+@unittest.mock.patch('pantos.common.servicenodes.requests.Session.get')
 def test_bids_service_node_html_response_client_error(mocked_get):
     url = 'mock_url'
     source_blockchain = Blockchain.ETHEREUM
@@ -209,6 +285,76 @@ def test_bids_service_node_html_response_client_error(mocked_get):
     assert not mocked_get.json.called
 
 
+@unittest.mock.patch('pantos.common.servicenodes.requests.Session.get')
+def test_bids_missing_field_client_error(mocked_get):
+    mocked_get.return_value = _create_response(
+        b'[{"fee": 100, "execution_time": 200, "valid_until": 300}]')
+    mocked_get.return_value.headers = mock_response_header_html
+
+    with pytest.raises(ServiceNodeClientError):
+        ServiceNodeClient().bids('mock_url', Blockchain.ETHEREUM,
+                                 Blockchain.BNB_CHAIN)
+
+
+@unittest.mock.patch.object(ServiceNodeClient, 'bids')
+def test_bids_of_service_nodes_correct(mocked_bids):
+    source_blockchain = Blockchain.ETHEREUM
+    destination_blockchain = Blockchain.BNB_CHAIN
+    bid = ServiceNodeBid(source_blockchain, destination_blockchain,
+                         mock_bid_response['fee'],
+                         mock_bid_response['execution_time'],
+                         mock_bid_response['valid_until'],
+                         mock_bid_response['signature'])
+
+    def bids(service_node_url, *args):
+        if service_node_url == 'failing_url':
+            raise ServiceNodeClientError('')
+        return [bid]
+
+    mocked_bids.side_effect = bids
+
+    service_node_bids = ServiceNodeClient().bids_of_service_nodes(
+        ['first_url', 'failing_url', 'second_url'], source_blockchain,
+        destination_blockchain, 10)
+
+    assert service_node_bids == {'first_url': [bid], 'second_url': [bid]}
+    mocked_bids.assert_any_call('first_url', source_blockchain,
+                                destination_blockchain, 10)
+    assert mocked_bids.call_count == 3
+
+
+@pytest.mark.parametrize(
+    'error',
+    [requests.exceptions.ConnectionError, requests.exceptions.Timeout])
+@unittest.mock.patch('pantos.common.servicenodes.requests.Session.get')
+def test_bids_connection_error(mocked_get, error):
+    mocked_get.side_effect = error
+
+    with pytest.raises(ServiceNodeClientError):
+        ServiceNodeClient().bids('mock_url', Blockchain.ETHEREUM,
+                                 Blockchain.BNB_CHAIN)
+
+
+@unittest.mock.patch('pantos.common.servicenodes.requests.Session.get')
+def test_bids_of_service_nodes_connection_error_correct(mocked_get):
+    def get(url, *args, **kwargs):
+        if url.startswith('failing_url/'):
+            raise requests.exceptions.ConnectionError
+        return _create_response(
+            b'[{"fee": 100, "execution_time": 200, "valid_until": 300, '
+            b'"signature": "mock_signature"}]')
+
+    mocked_get.side_effect = get
+    bid = ServiceNodeBid(Blockchain.ETHEREUM, Blockchain.BNB_CHAIN, 100, 200,
+                         300, 'mock_signature')
+
+    service_node_bids = ServiceNodeClient().bids_of_service_nodes(
+        ['first_url', 'failing_url', 'second_url'], Blockchain.ETHEREUM,
+        Blockchain.BNB_CHAIN)
+
+    assert service_node_bids == {'first_url': [bid], 'second_url': [bid]}
+
+
 def test_build_bids_url_no_slash_correct():
     url = 'some_url'
     result = ServiceNodeClient()._ServiceNodeClient__build_bids_url(url, 1, 4)
@@ -227,7 +373,7 @@ def test_build_bids_url_with_slash_correct():
 @unittest.mock.patch('pantos.common.servicenodes.BlockchainAddress')
 @unittest.mock.patch('pantos.common.servicenodes.Blockchain')
 @unittest.mock.patch('pantos.common.servicenodes.uuid')
-@unittest.mock.patch('pantos.common.servicenodes.requests.get')
+@unittest.mock.patch('pantos.common.servicenodes.requests.Session.get')
 def test_status_correct(mocked_get, mocked_uuid, mocked_blockchain,
                         mocked_blockchain_address, mocked_status):
     task_id = uuid.UUID('cf9ff19f-b691-46c6-8645-08d05309ea84')
@@ -261,7 +407,7 @@ def test_status_correct(mocked_get, mocked_uuid, mocked_blockchain,
 
 @unittest.mock.patch('pantos.common.servicenodes.locals',
                      return_value=['response'])
-@unittest.mock.patch('pantos.common.servicenodes.requests.get')
+@unittest.mock.patch('pantos.common.servicenodes.requests.Session.get')
 def test_status_exception(mocked_get, mocked_locals):
     task_id = uuid.UUID('cf9ff19f-b691-46c6-8645-08d05309ea84')
     mocked_get(
@@ -275,7 +421,7 @@ def test_status_exception(mocked_get, mocked_locals):
 
 @unittest.mock.patch('pantos.common.servicenodes.locals',
                      return_value=['response'])
-@unittest.mock.patch('pantos.common.servicenodes.requests.get')
+@unittest.mock.patch('pantos.common.servicenodes.requests.Session.get')
 def test_status_no_response_message_exception(mocked_get, mocked_locals):
     task_id = uuid.UUID('cf9ff19f-b691-46c6-8645-08d05309ea84')
     mocked_get(
@@ -288,7 +434,7 @@ def test_status_no_response_message_exception(mocked_get, mocked_locals):
 
 @unittest.mock.patch('pantos.common.servicenodes.locals',
                      return_value=['response'])
-@unittest.mock.patch('pantos.common.servicenodes.requests.get')
+@unittest.mock.patch('pantos.common.servicenodes.requests.Session.get')
 def test_status_html_response_message_exception(mocked_get, mocked_locals):
     task_id = uuid.UUID('cf9ff19f-b691-46c6-8645-08d05309ea84')
     mocked_get(
@@ -299,6 +445,18 @@ def test_status_html_response_message_exception(mocked_get, mocked_locals):
     assert not mocked_get.json.called
 
 
+@pytest.mark.parametrize(
+    'error',
+    [requests.exceptions.ConnectionError, requests.exceptions.Timeout])
+@unittest.mock.patch('pantos.common.servicenodes.requests.Session.get')
+def test_status_connection_error(mocked_get, error):
+    task_id = uuid.UUID('cf9ff19f-b691-46c6-8645-08d05309ea84')
+    mocked_get.side_effect = error
+
+    with pytest.raises(ServiceNodeClientError):
+        ServiceNodeClient().status('', task_id)
+
+
 def test_build_status_url_no_slash_correct():
     url = 'some_url'
     task_id = 'some_task_id'
@@ -313,3 +471,146 @@ def test_build_status_url_with_slash_correct():
     result = ServiceNodeClient()._ServiceNodeClient__build_status_url(
         url, task_id)
     assert result == 'some_url/transfer/some_task_id/status'
+
+
+def test_session_connections_pooled_correct():
+    service_node_client = ServiceNodeClient()
+
+    session = service_node_client._ServiceNodeClient__get_session()
+    for url_prefix in ['http://', 'https://']:
+        adapter = session.get_adapter(url_prefix + 'mock_url')
+        assert adapter._pool_connections == 32
+        assert adapter._pool_maxsize == 32
+
+
+def test_session_per_thread_correct():
+    service_node_client = ServiceNodeClient()
+    sessions = []
+
+    def get_session():
+        sessions.append(service_node_client._ServiceNodeClient__get_session())
+
+    get_session()
+    get_session()
+    thread = threading.Thread(target=get_session)
+    thread.start()
+    thread.join()
+
+    assert sessions[0] is sessions[1]
+    assert sessions[2] is not sessions[0]
+
+
+@unittest.mock.patch('pantos.common.servicenodes.requests.Session.close')
+def test_close_correct(mocked_close):
+    service_node_client = ServiceNodeClient()
+    session = service_node_client._ServiceNodeClient__get_session()
+    session_created = threading.Event()
+    client_closed = threading.Event()
+
+    def get_session():
+        service_node_client._ServiceNodeClient__get_session()
+        session_created.set()
+        client_closed.wait()
+
+    thread = threading.Thread(target=get_session)
+    thread.start()
+    session_created.wait()
+
+    service_node_client.close()
+    client_closed.set()
+    thread.join()
+
+    assert mocked_close.call_count == 2
+    assert service_node_client._ServiceNodeClient__get_session() is not \
+        session
+
+
+@unittest.mock.patch('pantos.common.servicenodes.requests.adapters.'
+                     'HTTPAdapter.close')
+def test_session_released_after_thread_terminated_correct(mocked_close):
+    service_node_client = ServiceNodeClient()
+    thread = threading.Thread(
+        target=service_node_client._ServiceNodeClient__get_session)
+    thread.start()
+    thread.join()
+    gc.collect()
+
+    mocked_close.assert_called_once()
+    assert len(service_node_client._ServiceNodeClient__sessions) == 0
+
+
+@unittest.mock.patch('pantos.common.servicenodes.requests.Session.close')
+def test_context_manager_closes_client_correct(mocked_close):
+    with ServiceNodeClient() as service_node_client:
+        service_node_client._ServiceNodeClient__get_session()
+        mocked_close.assert_not_called()
+
+    mocked_close.assert_called_once()
+
+
+@unittest.mock.patch('pantos.common.servicenodes.requests.Session.get')
+def test_session_reused_correct(mocked_get):
+    mocked_get().json.return_value = []
+    mocked_get.reset_mock()
+    service_node_client = ServiceNodeClient()
+
+    with unittest.mock.patch('pantos.common.servicenodes.requests.Session',
+                             wraps=requests.Session) as mocked_session:
+        service_node_client.bids('mock_url', Blockchain.ETHEREUM,
+                                 Blockchain.BNB_CHAIN)
+        service_node_client.bids('mock_url', Blockchain.ETHEREUM,
+                                 Blockchain.BNB_CHAIN)
+
+    mocked_session.assert_called_once()
+    assert mocked_get.call_count == 2
+
+
+@unittest.mock.patch('pantos.common.servicenodes.orjson', servicenodes_orjson)
+@unittest.mock.patch('pantos.common.servicenodes.requests.Session.get')
+def test_bids_large_fee_correct(mocked_get):
+    fee = 2**64 + 1
+    mocked_get.return_value = _create_response(
+        b'[{"fee": %d, "execution_time": 200, "valid_until": 300, '
+        b'"signature": "mock_signature"}]' % fee)
+
+    bids = ServiceNodeClient().bids('mock_url', Blockchain.ETHEREUM,
+                                    Blockchain.BNB_CHAIN)
+
+    assert bids == [
+        ServiceNodeBid(Blockchain.ETHEREUM, Blockchain.BNB_CHAIN, fee, 200,
+                       300, 'mock_signature')
+    ]
+    assert isinstance(bids[0].fee, int)
+
+
+@unittest.mock.patch('pantos.common.servicenodes.orjson', servicenodes_orjson)
+@unittest.mock.patch('pantos.common.servicenodes.requests.Session.get')
+def test_status_large_amounts_correct(mocked_get):
+    task_id = uuid.UUID('cf9ff19f-b691-46c6-8645-08d05309ea84')
+    token_amount = 123456789012345678901
+    fee = 2**64 + 1
+    mocked_get.return_value = _create_response(
+        b'{"task_id": "%s", "source_blockchain_id": 0, '
+        b'"destination_blockchain_id": 1, "sender_address": "sender_addr", '
+        b'"recipient_address": "recipient_addr", '
+        b'"source_token_address": "source_token", '
+        b'"destination_token_address": "destination_token", '
+        b'"amount": %d, "fee": %d, "status": "accepted", '
+        b'"transfer_id": 1, "transaction_id": "transaction_id"}' %
+        (str(task_id).encode(), token_amount, fee))
+
+    result = ServiceNodeClient().status('mock_url', task_id)
+
+    assert result.token_amount == token_amount
+    assert isinstance(result.token_amount, int)
+    assert result.fee == fee
+    assert isinstance(result.fee, int)
+
+
+@unittest.mock.patch('pantos.common.servicenodes.requests.Session.post')
+def test_submit_transfer_invalid_json_response_exception(mocked_post):
+    mocked_post.return_value = _create_response(b'{"task_id": ')
+    mocked_post.return_value.headers = mock_response_header_html
+
+    with pytest.raises(ServiceNodeClientError):
+        ServiceNodeClient().submit_transfer(mock_transfer_request)
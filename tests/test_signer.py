@@ -1,11 +1,22 @@
+import concurrent.futures
 from unittest.mock import MagicMock
 from unittest.mock import patch
 
+import Crypto.PublicKey.ECC
+import Crypto.Signature.eddsa
 import pytest
 
 from pantos.common.blockchains.enums import Blockchain
 from pantos.common.signer import SignerError
+from pantos.common.signer import _NaclEdDSASigScheme
 from pantos.common.signer import get_signer
+from pantos.common.signer import nacl
+
+
+@pytest.fixture(autouse=True)
+def signer_cache():
+    with patch.dict('pantos.common.signer._signer_cache', clear=True):
+        yield
 
 
 def test_signer_init_unable_to_load_key():
@@ -13,19 +24,14 @@ def test_signer_init_unable_to_load_key():
         get_signer('', '')
 
 
-@patch('pantos.common.signer._signer', None)
 @patch('pantos.common.signer.Crypto')
-@patch('pantos.common.signer.getpass')
-def test_signer_load_signer_correct_path(mocked_getpass, mocked_crypto):
-    get_signer('', None)
+def test_signer_load_signer_no_password(mocked_crypto):
+    with pytest.raises(SignerError):
+        get_signer('', None)
 
-    mocked_getpass.getpass.assert_called_once_with(
-        'Password for decrypting the pem file')
-    mocked_crypto.PublicKey.ECC.import_key.assert_called_once_with(
-        '', passphrase=mocked_getpass.getpass())
+    mocked_crypto.PublicKey.ECC.import_key.assert_not_called()
 
 
-@patch('pantos.common.signer._signer', None)
 @patch('pantos.common.signer.Crypto')
 def test_signer_load_signer_correct_value(mocked_crypto):
     get_signer('test', 'mocked_password')
@@ -33,11 +39,9 @@ def test_signer_load_signer_correct_value(mocked_crypto):
     mocked_crypto.Signature.eddsa.new.assert_called_once()
 
 
-@patch('pantos.common.signer._signer', None)
 @patch('pantos.common.signer.Crypto')
-@patch('pantos.common.signer.getpass')
-def test_signer_sign_message_correct(mocked_getpass, mocked_crypto):
-    signer = get_signer('', None)
+def test_signer_sign_message_correct(mocked_crypto):
+    signer = get_signer('', 'password')
 
     signer.sign_message('')
 
@@ -45,9 +49,8 @@ def test_signer_sign_message_correct(mocked_getpass, mocked_crypto):
 
 
 @patch('pantos.common.signer.Crypto')
-@patch('pantos.common.signer.getpass')
-def test_signer_sign_message_error(mocked_getpass, mocked_crypto):
-    signer = get_signer('', None)
+def test_signer_sign_message_error(mocked_crypto):
+    signer = get_signer('', 'password')
     message = MagicMock()
     message.encode.side_effect = Exception
 
@@ -55,10 +58,24 @@ def test_signer_sign_message_error(mocked_getpass, mocked_crypto):
         signer.sign_message(message)
 
 
+@pytest.mark.parametrize('message, formatted_message',
+                         [('message', 'message'), (b'message', "b'message'")])
 @patch('pantos.common.signer.Crypto')
-@patch('pantos.common.signer.getpass')
-def test_signer_verify_message_correct(mocked_getpass, mocked_crypto):
-    signer = get_signer('', None)
+def test_signer_sign_message_error_text(mocked_crypto, message,
+                                        formatted_message):
+    signer = get_signer('', 'password')
+    mocked_crypto.Signature.eddsa.new().sign.side_effect = Exception
+
+    with pytest.raises(SignerError) as exception_info:
+        signer.sign_message(message)
+
+    assert exception_info.value.args[0] == (
+        f'unable to compute signature of message: {formatted_message}')
+
+
+@patch('pantos.common.signer.Crypto')
+def test_signer_verify_message_correct(mocked_crypto):
+    signer = get_signer('', 'password')
 
     result = signer.verify_message('message', '')
 
@@ -66,9 +83,8 @@ def test_signer_verify_message_correct(mocked_getpass, mocked_crypto):
 
 
 @patch('pantos.common.signer.Crypto')
-@patch('pantos.common.signer.getpass')
-def test_signer_verify_message_false(mocked_getpass, mocked_crypto):
-    signer = get_signer('', None)
+def test_signer_verify_message_false(mocked_crypto):
+    signer = get_signer('', 'password')
 
     result = signer.verify_message('message', 'signature')
 
@@ -76,9 +92,35 @@ def test_signer_verify_message_false(mocked_getpass, mocked_crypto):
 
 
 @patch('pantos.common.signer.Crypto')
-@patch('pantos.common.signer.getpass')
-def test_signer_verify_message_raises_exception(mocked_getpass, mocked_crypto):
-    signer = get_signer('', None)
+def test_signer_verify_message_cached(mocked_crypto):
+    signer = get_signer('', 'password')
+    mocked_verify = mocked_crypto.Signature.eddsa.new().verify
+
+    first_result = signer.verify_message('message', '00')
+    second_result = signer.verify_message(b'message', b'\x00')
+    signer.verify_message('other message', '00')
+
+    assert first_result is True
+    assert second_result is True
+    assert mocked_verify.call_count == 2
+
+
+@patch('pantos.common.signer._VERIFICATION_CACHE_SIZE', 1)
+@patch('pantos.common.signer.Crypto')
+def test_signer_verify_message_cache_bounded(mocked_crypto):
+    signer = get_signer('', 'password')
+    mocked_verify = mocked_crypto.Signature.eddsa.new().verify
+
+    signer.verify_message('message', '00')
+    signer.verify_message('other message', '00')
+    signer.verify_message('message', '00')
+
+    assert mocked_verify.call_count == 3
+
+
+@patch('pantos.common.signer.Crypto')
+def test_signer_verify_message_raises_exception(mocked_crypto):
+    signer = get_signer('', 'password')
 
     message = MagicMock()
     message.encode.side_effect = Exception
@@ -88,10 +130,128 @@ def test_signer_verify_message_raises_exception(mocked_getpass, mocked_crypto):
 
 
 @patch('pantos.common.signer.Crypto')
-@patch('pantos.common.signer.getpass')
-def test_build_message(mocked_getpass, mocked_crypto):
-    signer = get_signer('', None)
+def test_build_message(mocked_crypto):
+    signer = get_signer('', 'password')
 
     message = signer.build_message('-', 0, 0, [Blockchain.ETHEREUM])
 
     assert message == '0-0-[<Blockchain.ETHEREUM: 0>]'
+
+
+@pytest.mark.parametrize('separator, message_parts, expected_message',
+                         [('', ('ab', 'cd'), 'abc'), (', ', (1, 2), '1, 2,'),
+                          ('--', (0, 'a', None), '0--a--None-'), ('-', (), ''),
+                          (', ', (), '')])
+@patch('pantos.common.signer.Crypto')
+def test_build_message_separators(mocked_crypto, separator, message_parts,
+                                  expected_message):
+    signer = get_signer('', 'password')
+
+    message = signer.build_message(separator, *message_parts)
+
+    assert message == expected_message
+
+
+@pytest.fixture(scope='module')
+def ed25519_private_key():
+    return Crypto.PublicKey.ECC.generate(curve='Ed25519')
+
+
+@pytest.fixture(scope='module')
+def ed25519_pem_value(ed25519_private_key):
+    return ed25519_private_key.export_key(
+        format='PEM', passphrase='password',
+        protection='PBKDF2WithHMAC-SHA512AndAES256-CBC')
+
+
+@pytest.mark.skipif(nacl is None, reason='PyNaCl is not installed')
+def test_signer_nacl_signature_correct(ed25519_private_key, ed25519_pem_value):
+    signer = get_signer(ed25519_pem_value, 'password')
+
+    signature = signer.sign_message('message')
+
+    assert isinstance(signer._Signer__signer, _NaclEdDSASigScheme)
+    assert bytes.fromhex(signature) == Crypto.Signature.eddsa.new(
+        ed25519_private_key, 'rfc8032').sign(b'message')
+    assert signer.verify_message('message', signature) is True
+    assert signer.verify_message('other message', signature) is False
+    assert signer.verify_message('message', signature[:-2]) is False
+
+
+@patch('pantos.common.signer.nacl', None)
+def test_signer_without_nacl_correct(ed25519_pem_value):
+    signer = get_signer(ed25519_pem_value, 'password')
+
+    signature = signer.sign_message('message')
+
+    assert not isinstance(signer._Signer__signer, _NaclEdDSASigScheme)
+    assert signer.verify_message('message', signature) is True
+    assert signer.verify_message('other message', signature) is False
+
+
+@patch('pantos.common.signer.Crypto')
+def test_get_signer_cached_correct(mocked_crypto):
+    first_signer = get_signer('first', 'password')
+    second_signer = get_signer('second', 'password')
+
+    assert get_signer('first', 'password') is first_signer
+    assert get_signer('second', 'password') is second_signer
+    assert first_signer is not second_signer
+    assert mocked_crypto.PublicKey.ECC.import_key.call_count == 2
+
+
+def test_signer_bytes_correct(ed25519_pem_value):
+    signer = get_signer(ed25519_pem_value, 'password')
+
+    signature = signer.sign_message(b'message')
+
+    assert signature == signer.sign_message('message')
+    assert signer.verify_message(b'message', bytes.fromhex(signature)) is True
+    assert signer.verify_message(b'message', signature) is True
+    assert signer.verify_message(b'other message',
+                                 bytes.fromhex(signature)) is False
+
+
+def test_signer_sign_message_raw_correct(ed25519_pem_value):
+    signer = get_signer(ed25519_pem_value, 'password')
+
+    signature = signer.sign_message_raw(b'message')
+
+    assert len(signature) == 64
+    assert signature.hex() == signer.sign_message('message')
+    assert signer.verify_message(b'message', signature) is True
+
+
+def test_signer_verify_messages_correct(ed25519_pem_value):
+    signer = get_signer(ed25519_pem_value, 'password')
+    first_signature = signer.sign_message('first message')
+    second_signature = signer.sign_message('second message')
+
+    results = signer.verify_messages([('first message', first_signature),
+                                      (b'second message',
+                                       bytes.fromhex(second_signature)),
+                                      ('second message', first_signature),
+                                      ('first message', 'no hex')])
+
+    assert results == [True, True, False, False]
+
+
+@patch('pantos.common.signer.Crypto')
+def test_signer_verify_messages_raises_exception(mocked_crypto):
+    signer = get_signer('', 'password')
+    message = MagicMock()
+    message.encode.side_effect = Exception
+
+    with pytest.raises(SignerError):
+        signer.verify_messages([('message', ''), (message, '')])
+
+
+@patch('pantos.common.signer.Crypto')
+def test_get_signer_concurrently_loaded_once(mocked_crypto):
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        signers = list(
+            executor.map(lambda _: get_signer('pem', 'password'), range(32)))
+
+    assert all(signer is signers[0] for signer in signers)
+    mocked_crypto.PublicKey.ECC.import_key.assert_called_once_with(
+        'pem', passphrase='password')